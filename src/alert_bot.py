@@ -29,16 +29,18 @@ import asyncio
 import gc
 import logging
 import logging.handlers
+import queue
+import secrets
 import signal
-import subprocess
+import socket
 import sys
 import time
-from collections import deque
-from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
+from collections import defaultdict, deque
+from collections.abc import Mapping
 from datetime import datetime
+from functools import cache, partial
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 import psutil
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Update
@@ -51,47 +53,127 @@ from telegram.ext import (
 )
 
 # Import local config loader
-try:
-    from config_loader import load_config, load_service_monitoring
-except ImportError:
-    sys.path.insert(0, str(Path(__file__).parent))
-    from config_loader import load_config, load_service_monitoring
-
-# Configure logging with fallback for missing log directory
-log_handlers = [logging.StreamHandler()]
-
-# Load configuration
-CONFIG = load_config()
-SERVICE_CONFIG = load_service_monitoring()
-
-LOG_CONFIG = CONFIG.get("logging", {})
-LOG_DIR = Path(LOG_CONFIG.get("log_dir", "/var/log/telegram-monitor"))
-
-try:
-    LOG_DIR.mkdir(parents=True, exist_ok=True)
-    log_handlers.append(
-        logging.handlers.RotatingFileHandler(
-            str(LOG_DIR / "alert-bot.log"),
+_SRC_DIR = str(Path(__file__).parent)
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
+
+from config_loader import (
+    clear_yaml_cache,
+    load_config,
+    load_service_monitoring,
+    parse_admin_ids,
+)
+
+
+# Configuration is parsed lazily and cached only until the bot has copied out
+# the fields it needs (see async_main), so the parsed YAML can be freed.
+@cache
+def _config() -> dict[str, Any]:
+    """Return the cached main configuration."""
+    return load_config()
+
+
+@cache
+def _service_config() -> Mapping[str, Any]:
+    """Return the cached service monitoring configuration."""
+    return load_service_monitoring()
+
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# File writes happen on the listener's background thread, keeping (slow SD card)
+# disk I/O off the event loop. The QueueHandler feeding this queue is attached
+# together with the listener, so importing the module never fills it.
+_log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+
+
+def _start_log_listener() -> logging.handlers.QueueListener:
+    """
+    Create the log file handler and route root logging to it via a queue.
+
+    Resolved here rather than at import so that importing the module does
+    not load the configuration.
+
+    Returns:
+        The running QueueListener (stop it to flush remaining records)
+    """
+    log_config = _config().get("logging") or {}
+    log_dir = Path(log_config.get("log_dir", "/var/log/telegram-monitor"))
+
+    # Fall back to /tmp if the log directory is missing or not writable
+    try:
+        log_dir.mkdir(parents=True, exist_ok=True)
+        file_handler = logging.handlers.RotatingFileHandler(
+            str(log_dir / "alert-bot.log"),
             maxBytes=5 * 1024 * 1024,  # 5MB max
             backupCount=2,
         )
-    )
-except (PermissionError, OSError):
-    # Fallback to /tmp
-    tmp_log = Path("/tmp/alert-bot.log")
-    log_handlers.append(
-        logging.handlers.RotatingFileHandler(
+    except (PermissionError, OSError):
+        tmp_log = Path("/tmp/alert-bot.log")
+        file_handler = logging.handlers.RotatingFileHandler(
             str(tmp_log), maxBytes=5 * 1024 * 1024, backupCount=2
         )
+
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    listener = logging.handlers.QueueListener(
+        _log_queue, file_handler, respect_handler_level=True
     )
+    listener.start()
+    logging.getLogger().addHandler(logging.handlers.QueueHandler(_log_queue))
+    return listener
+
 
 logging.basicConfig(
     level=logging.WARNING,  # WARNING for production on low-memory devices
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=log_handlers,
+    format=LOG_FORMAT,
+    handlers=[logging.StreamHandler()],
 )
 logger = logging.getLogger(__name__)
 
+# Admin session lifetime after successful 2FA (seconds)
+ADMIN_SESSION_TTL = 3600
+
+# Per-user rate limits: action -> (max requests, window seconds)
+RATE_LIMITS: dict[str, tuple[int, int]] = {
+    "restart": (3, 3600),  # 3 restarts per hour
+    "auth": (5, 300),  # 5 2FA code attempts per 5 min
+}
+
+# Drop idle (refilled) rate-limit buckets every N rate-limit checks
+BUCKET_SWEEP_INTERVAL = 64
+
+# Lifetime of a pending 2FA code and of recorded failed attempts (seconds)
+TWO_FA_CODE_TTL = 300
+AUTH_ATTEMPT_WINDOW = 3600
+
+# Failed 2FA attempts within AUTH_ATTEMPT_WINDOW before /auth is locked
+AUTH_MAX_FAILURES = 5
+
+# Sweep expired 2FA state every N insertions (amortized O(1))
+AUTH_SWEEP_INTERVAL = 64
+
+# Message templates for /status and /memory
+_STATUS_TEMPLATE = (
+    "*System Status*\n"
+    "━━━━━━━━━━━━━━━\n"
+    "🖥 Host: {host}\n"
+    "⏱ Uptime: {uptime}\n"
+    "🔧 CPU: {cpu}%\n"
+    "💾 Memory: {mem_mb:.1f}MB ({mem_pct:.1f}%)\n"
+    "💿 Disk: {disk}% used\n"
+    "🌡 Temp: {temp}°C\n"
+)
+_MEMORY_TEMPLATE = (
+    "*Memory Usage*\n"
+    "━━━━━━━━━━━━━━━\n"
+    "🤖 Bot Process: {bot_mb:.1f}MB\n"
+    "📊 System RAM: {ram_pct}% used\n"
+    "💾 Available: {available_mb:.0f}MB\n"
+    "🔄 Swap: {swap_pct}% used\n\n"
+    "⚠️ Bot limit: {limit_mb}MB\n"
+)
+
 
 class BotConfig:
     """Configuration with memory optimization via __slots__."""
@@ -100,8 +182,6 @@ class BotConfig:
         "token",
         "chat_id",
         "admin_ids",
-        "admin_sessions",
-        "rate_limits",
         "quiet_hours",
         "batch_window",
         "memory_limit_mb",
@@ -109,8 +189,10 @@ class BotConfig:
     ]
 
     def __init__(self) -> None:
-        telegram_config = CONFIG.get("telegram", {})
-        memory_config = CONFIG.get("memory", {})
+        config = _config()
+        telegram_config = config.get("telegram") or {}
+        memory_config = config.get("memory") or {}
+        ssh_config = config.get("ssh") or {}
 
         # Credentials from config or environment
         import os
@@ -124,25 +206,16 @@ class BotConfig:
 
         admin_ids_env = os.environ.get("TELEGRAM_ADMIN_IDS")
         if admin_ids_env:
-            self.admin_ids = set(admin_ids_env.split(","))
+            admin_list = [aid for aid in admin_ids_env.split(",") if aid.strip()]
         else:
             admin_list = telegram_config.get("admin_ids", [])
-            self.admin_ids = set(str(aid) for aid in admin_list)
+        self.admin_ids = parse_admin_ids(admin_list)
 
         # Validation
         if not self.token:
             logger.error("No bot token configured!")
             raise ValueError("TELEGRAM_BOT_TOKEN not found")
 
-        # Admin session management (for 2FA)
-        self.admin_sessions: dict[str, datetime] = {}
-
-        # Rate limiting
-        self.rate_limits = {
-            "restart": {"max": 3, "window": 3600},  # 3 restarts per hour
-            "logs": {"max": 10, "window": 600},  # 10 log requests per 10 min
-        }
-
         # Quiet hours (22:00 - 07:00)
         self.quiet_hours = {"start": 22, "end": 7}
 
@@ -153,24 +226,52 @@ class BotConfig:
         self.memory_limit_mb = memory_config.get("limit_mb", 50)
 
         # SSH connection pool
-        self.ssh_max_connections = CONFIG.get("ssh", {}).get("max_connections", 3)
+        self.ssh_max_connections = ssh_config.get("max_connections", 3)
+
+
+class TokenBucket:
+    """Token-bucket rate limiter: O(1) state, allows bursts up to capacity."""
+
+    __slots__ = ["tokens", "capacity", "rate", "last"]
+
+    def __init__(self, capacity: float, rate: float) -> None:
+        self.tokens = capacity
+        self.capacity = capacity
+        self.rate = rate  # tokens per second
+        self.last = time.monotonic()
+
+    def consume(self, cost: float = 1) -> bool:
+        """Take tokens from the bucket; return False if not enough are left."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+        if self.tokens >= cost:
+            self.tokens -= cost
+            return True
+        return False
+
+    def is_idle(self, now: float) -> bool:
+        """Return True if the bucket has refilled, i.e. equals a fresh one."""
+        return self.tokens + (now - self.last) * self.rate >= self.capacity
 
 
 class MemoryManager:
     """Manages memory usage for low-memory device optimization."""
 
-    __slots__ = ["_last_gc", "_gc_interval", "_memory_threshold"]
+    __slots__ = ["_last_gc", "_gc_interval", "_memory_threshold", "_proc", "_total_mb"]
 
     def __init__(self) -> None:
-        memory_config = CONFIG.get("memory", {})
+        memory_config = _config().get("memory") or {}
         self._last_gc = time.time()
         self._gc_interval = memory_config.get("gc_interval", 300)  # 5 minutes
         self._memory_threshold = memory_config.get("threshold_mb", 45)
+        self._proc = psutil.Process()
+        # System RAM does not change at runtime
+        self._total_mb = psutil.virtual_memory().total / 1024 / 1024
 
-    async def check_memory(self) -> dict[str, float]:
-        """Check current memory usage and run GC if needed."""
-        process = psutil.Process()
-        memory_mb = process.memory_info().rss / 1024 / 1024
+    async def check_memory_fast(self) -> tuple[float, float]:
+        """Check memory usage, run GC if needed, return (used_mb, percent)."""
+        memory_mb = self._proc.memory_info().rss / 1024 / 1024
 
         # Run GC if needed
         if (
@@ -179,81 +280,153 @@ class MemoryManager:
         ):
             gc.collect()
             self._last_gc = time.time()
-            new_memory_mb = process.memory_info().rss / 1024 / 1024
+            new_memory_mb = self._proc.memory_info().rss / 1024 / 1024
             logger.info(f"GC: {memory_mb:.1f}MB -> {new_memory_mb:.1f}MB")
             memory_mb = new_memory_mb
 
-        # Assume 512MB total for resource-constrained devices
-        total_mb = psutil.virtual_memory().total / 1024 / 1024
+        return memory_mb, (memory_mb / self._total_mb) * 100
+
+    async def check_memory(self) -> dict[str, float]:
+        """Check current memory usage and run GC if needed."""
+        used_mb, percent = await self.check_memory_fast()
         return {
-            "used_mb": memory_mb,
-            "percent": (memory_mb / total_mb) * 100,
+            "used_mb": used_mb,
+            "percent": percent,
             "threshold_mb": self._memory_threshold,
         }
 
 
 class AlertBatcher:
-    """Batches alerts for efficient sending."""
+    """Batches alerts for efficient sending.
+
+    Queued alerts are stored column-wise (parallel deques of timestamp, level,
+    source and message) rather than as one dict per alert; other alert keys
+    are not kept.
+    """
 
-    __slots__ = ["_queue", "_batch_task", "_batch_window", "_max_batch_size"]
+    __slots__ = [
+        "_ts",
+        "_level",
+        "_source",
+        "_message",
+        "_wakeup",
+        "_batch_task",
+        "_batch_window",
+        "_max_batch_size",
+    ]
 
     def __init__(self, batch_window: int = 10) -> None:
-        self._queue: deque = deque(maxlen=100)
+        self._ts: deque[float] = deque(maxlen=100)
+        self._level: deque[str] = deque(maxlen=100)
+        self._source: deque[str] = deque(maxlen=100)
+        self._message: deque[str] = deque(maxlen=100)
+        self._wakeup = asyncio.Event()  # Set on every push
         self._batch_task: asyncio.Task | None = None
         self._batch_window = batch_window
         self._max_batch_size = 10
 
     async def add_alert(self, alert: dict[str, Any]) -> None:
         """Add alert to batch queue."""
-        self._queue.append({"timestamp": datetime.now(), **alert})
+        self._ts.append(time.time())
+        self._level.append(alert.get("level", "INFO"))
+        self._source.append(alert.get("source", "system"))
+        self._message.append(alert.get("message", ""))
+        self._wakeup.set()
 
         # Start batch task if not running
         if not self._batch_task or self._batch_task.done():
             self._batch_task = asyncio.create_task(self._process_batch())
 
     async def _process_batch(self) -> dict[str, list[dict[str, Any]]] | None:
-        """Process batched alerts."""
-        await asyncio.sleep(self._batch_window)
-
-        if not self._queue:
+        """Process batched alerts.
+
+        Waits up to the batch window, but emits as soon as a full batch is
+        queued and returns immediately if the queue is empty.
+        """
+        deadline = time.monotonic() + self._batch_window
+        while self._ts and len(self._ts) < self._max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), remaining)
+            except asyncio.TimeoutError:
+                break
+
+        if not self._ts:
             return None
 
-        # Group alerts by type/severity
-        batched: dict[str, list[dict[str, Any]]] = {}
-        while self._queue and len(batched) < self._max_batch_size:
-            alert = self._queue.popleft()
-            key = f"{alert.get('level', 'INFO')}:{alert.get('source', 'system')}"
-
-            if key not in batched:
-                batched[key] = []
-            batched[key].append(alert)
+        # Group alert indices by type/severity
+        groups: dict[str, list[int]] = {}
+        consumed = 0
+        for level, source in zip(self._level, self._source):
+            if len(groups) >= self._max_batch_size:
+                break
+            groups.setdefault(f"{level}:{source}", []).append(consumed)
+            consumed += 1
+
+        # Materialize alert dicts only for the emitted entries
+        batched = {
+            key: [
+                {
+                    "timestamp": datetime.fromtimestamp(self._ts[i]).isoformat(
+                        timespec="seconds"
+                    ),
+                    "level": self._level[i],
+                    "source": self._source[i],
+                    "message": self._message[i],
+                }
+                for i in indices
+            ]
+            for key, indices in groups.items()
+        }
+        for _ in range(consumed):
+            self._ts.popleft()
+            self._level.popleft()
+            self._source.popleft()
+            self._message.popleft()
 
         return batched
 
 
+class _PoolCtx:
+    """Lightweight async context manager for borrowing a pool slot."""
+
+    __slots__ = ["_pool", "_host"]
+
+    def __init__(self, pool: "SSHConnectionPool", host: str) -> None:
+        self._pool = pool
+        self._host = host
+
+    async def __aenter__(self) -> str:
+        await self._pool.acquire()
+        return self._host
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self._pool.release()
+
+
 class SSHConnectionPool:
     """Manages SSH connections with pooling for resource efficiency."""
 
-    __slots__ = ["_connections", "_max_connections", "_lock"]
+    __slots__ = ["_sem", "_max_connections"]
 
     def __init__(self, max_connections: int = 3) -> None:
-        self._connections: list[str] = []
+        self._sem = asyncio.Semaphore(max_connections)
         self._max_connections = max_connections
-        self._lock = asyncio.Lock()
 
-    @asynccontextmanager
-    async def get_connection(self, host: str) -> AsyncGenerator[str, None]:
-        """Get SSH connection from pool."""
-        async with self._lock:
-            while len(self._connections) >= self._max_connections:
-                await asyncio.sleep(0.1)
-            self._connections.append(host)
+    async def acquire(self) -> None:
+        """Acquire a pool slot (waits until one is free)."""
+        await self._sem.acquire()
 
-        try:
-            yield host
-        finally:
-            async with self._lock:
-                self._connections.remove(host)
+    def release(self) -> None:
+        """Release a previously acquired pool slot."""
+        self._sem.release()
+
+    def get_connection(self, host: str) -> _PoolCtx:
+        """Get SSH connection from pool (use with ``async with``)."""
+        return _PoolCtx(self, host)
 
 
 class TelegramAlertBot:
@@ -266,12 +439,53 @@ class TelegramAlertBot:
         self.ssh_pool = SSHConnectionPool(config.ssh_max_connections)
         self.application: Application | None = None
 
+        # Admin session management (for 2FA): user id -> monotonic expiry
+        self.admin_sessions: dict[int, float] = {}
+
+        # Rate limiting: action -> user id -> token bucket (created on demand)
+        self._buckets: dict[str, defaultdict[int, TokenBucket]] = {
+            action: defaultdict(partial(TokenBucket, max_calls, max_calls / window))
+            for action, (max_calls, window) in RATE_LIMITS.items()
+        }
+        self._rate_checks = 0
+
         # 2FA tracking
-        self.auth_attempts: dict[str, list[datetime]] = {}
-        self.two_fa_codes: dict[str, str] = {}
+        self.auth_attempts: dict[int, list[float]] = {}  # failed attempt times
+        self.two_fa_codes: dict[int, tuple[str, float]] = {}  # (code, expiry)
+        self._auth_inserts = 0
 
         # Allowed services for restart
-        self.allowed_services = SERVICE_CONFIG.get("allowed_restart", [])
+        self.allowed_services = _service_config().get("allowed_restart", [])
+
+        # Service selection keyboard is static, build it once
+        self._restart_markup = InlineKeyboardMarkup(
+            [
+                [InlineKeyboardButton(svc, callback_data=f"restart_{svc}")]
+                for svc in self.allowed_services[:4]  # Limit to first 4
+            ]
+            + [[InlineKeyboardButton("Cancel", callback_data="restart_cancel")]]
+        )
+
+        # Prime CPU sampling so /status can read it without blocking
+        psutil.cpu_percent(interval=None)
+
+        # Static host info, read once instead of per /status
+        self._hostname = socket.gethostname()
+        self._temp_fd: TextIO | None
+        try:
+            self._temp_fd = open("/sys/class/thermal/thermal_zone0/temp")
+        except OSError:
+            self._temp_fd = None
+
+    def _check_rate_limit(self, user_id: int, action: str) -> bool:
+        """Return True if the user may perform the action now."""
+        self._rate_checks += 1
+        if not self._rate_checks % BUCKET_SWEEP_INTERVAL:
+            now = time.monotonic()
+            for buckets in self._buckets.values():
+                for uid in [u for u, b in buckets.items() if b.is_idle(now)]:
+                    del buckets[uid]
+        return self._buckets[action][user_id].consume()
 
     async def start_command(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
@@ -296,22 +510,22 @@ class TelegramAlertBot:
         await update.message.reply_text("⏳ Checking system status...")
 
         # Check memory first
-        memory = await self.memory_manager.check_memory()
+        used_mb, percent = await self.memory_manager.check_memory_fast()
 
         # Get system stats
-        cpu_percent = psutil.cpu_percent(interval=1)
+        # Non-blocking: usage since the previous sample (primed in __init__)
+        cpu_percent = psutil.cpu_percent(interval=None)
         disk = psutil.disk_usage("/")
         uptime = datetime.now() - datetime.fromtimestamp(psutil.boot_time())
 
-        status_text = (
-            f"*System Status*\n"
-            f"━━━━━━━━━━━━━━━\n"
-            f"🖥 Host: {self._get_hostname()}\n"
-            f"⏱ Uptime: {str(uptime).split('.')[0]}\n"
-            f"🔧 CPU: {cpu_percent}%\n"
-            f"💾 Memory: {memory['used_mb']:.1f}MB ({memory['percent']:.1f}%)\n"
-            f"💿 Disk: {disk.percent}% used\n"
-            f"🌡 Temp: {self._get_cpu_temp()}°C\n"
+        status_text = _STATUS_TEMPLATE.format(
+            host=self._get_hostname(),
+            uptime=str(uptime).split(".")[0],
+            cpu=cpu_percent,
+            mem_mb=used_mb,
+            mem_pct=percent,
+            disk=disk.percent,
+            temp=self._get_cpu_temp(),
         )
 
         await update.message.reply_text(status_text, parse_mode=ParseMode.MARKDOWN)
@@ -323,7 +537,7 @@ class TelegramAlertBot:
         user = update.effective_user
 
         # Check if user is admin
-        if str(user.id) not in self.config.admin_ids:
+        if user.id not in self.config.admin_ids:
             logger.warning(f"Unauthorized restart attempt by {user.username}")
             await update.message.reply_text(
                 "❌ Unauthorized. This incident has been logged."
@@ -331,20 +545,18 @@ class TelegramAlertBot:
             return
 
         # Check if already authenticated (session valid for 1 hour)
-        session_time = self.config.admin_sessions.get(str(user.id))
-        if session_time and (datetime.now() - session_time).seconds < 3600:
+        if self.admin_sessions.get(user.id, 0) > time.monotonic():
             await self._handle_restart(update, context)
         else:
             await self._request_2fa(update)
 
     async def _request_2fa(self, update: Update) -> None:
         """Request 2FA authentication."""
-        import random
-        import string
-
         user = update.effective_user
-        code = "".join(random.choices(string.digits, k=6))
-        self.two_fa_codes[str(user.id)] = code
+        code = f"{secrets.randbelow(1_000_000):06d}"
+        now = time.monotonic()
+        self.two_fa_codes[user.id] = (code, now + TWO_FA_CODE_TTL)
+        self._note_auth_insert(now)
 
         logger.info(f"2FA code for {user.username}: {code}")
 
@@ -365,16 +577,37 @@ class TelegramAlertBot:
             await update.message.reply_text("Usage: /auth CODE")
             return
 
+        if not self._check_rate_limit(user.id, "auth"):
+            logger.warning(f"2FA rate limit exceeded by {user.username}")
+            await update.message.reply_text(
+                "⏳ Too many authentication attempts. Please slow down."
+            )
+            return
+
         provided_code = context.args[0]
-        expected_code = self.two_fa_codes.get(str(user.id))
+        pending = self.two_fa_codes.get(user.id)
+        now = time.monotonic()
+
+        cutoff = now - AUTH_ATTEMPT_WINDOW
+        failures = [t for t in self.auth_attempts.get(user.id, ()) if t > cutoff]
+        if len(failures) >= AUTH_MAX_FAILURES:
+            # Locked out: also void the pending code so it cannot be guessed
+            self.two_fa_codes.pop(user.id, None)
+            logger.warning(f"2FA locked for {user.username} after failed attempts")
+            await update.message.reply_text(
+                "🔒 Too many failed attempts. Try again later."
+            )
+            return
 
-        if not expected_code:
+        if not pending or pending[1] <= now:
+            self.two_fa_codes.pop(user.id, None)
             await update.message.reply_text("❌ No authentication requested")
             return
 
-        if provided_code == expected_code:
-            self.config.admin_sessions[str(user.id)] = datetime.now()
-            del self.two_fa_codes[str(user.id)]
+        if provided_code == pending[0]:
+            self.admin_sessions[user.id] = time.monotonic() + ADMIN_SESSION_TTL
+            del self.two_fa_codes[user.id]
+            self.auth_attempts.pop(user.id, None)
             await update.message.reply_text(
                 "✅ Authentication successful!\n"
                 "Session valid for 1 hour.\n"
@@ -382,26 +615,36 @@ class TelegramAlertBot:
             )
             logger.info(f"2FA successful for {user.username}")
         else:
+            self.auth_attempts.setdefault(user.id, []).append(now)
+            self._note_auth_insert(now)
             await update.message.reply_text("❌ Invalid code")
             logger.warning(f"2FA failed for {user.username}")
 
+    def _note_auth_insert(self, now: float) -> None:
+        """Count a 2FA state insertion and periodically evict expired entries."""
+        self._auth_inserts += 1
+        if self._auth_inserts % AUTH_SWEEP_INTERVAL:
+            return
+
+        self.two_fa_codes = {
+            uid: entry for uid, entry in self.two_fa_codes.items() if entry[1] > now
+        }
+        cutoff = now - AUTH_ATTEMPT_WINDOW
+        attempts: dict[int, list[float]] = {}
+        for uid, times in self.auth_attempts.items():
+            recent = [t for t in times if t > cutoff]
+            if recent:
+                attempts[uid] = recent
+        self.auth_attempts = attempts
+
     async def _handle_restart(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ) -> None:
         """Handle service restart after authentication."""
         if not context.args:
             # Show service selection
-            buttons = [
-                [InlineKeyboardButton(svc, callback_data=f"restart_{svc}")]
-                for svc in self.allowed_services[:4]  # Limit to first 4
-            ]
-            buttons.append(
-                [InlineKeyboardButton("Cancel", callback_data="restart_cancel")]
-            )
-            reply_markup = InlineKeyboardMarkup(buttons)
-
             await update.message.reply_text(
-                "Select service to restart:", reply_markup=reply_markup
+                "Select service to restart:", reply_markup=self._restart_markup
             )
         else:
             service = context.args[0]
@@ -413,31 +656,48 @@ class TelegramAlertBot:
             await update.message.reply_text(f"❌ Service '{service}' not allowed")
             return
 
+        # Charged only for actual restarts (menu and 2FA steps are free)
+        user = update.effective_user
+        if not self._check_rate_limit(user.id, "restart"):
+            logger.warning(f"Restart rate limit exceeded by {user.username}")
+            await update.message.reply_text(
+                "⏳ Too many restart requests. Please slow down."
+            )
+            return
+
         await update.message.reply_text(f"♻️ Restarting {service}...")
 
         try:
-            result = subprocess.run(
-                ["sudo", "systemctl", "restart", service],
-                capture_output=True,
-                text=True,
-                timeout=30,
-                check=False,
+            proc = await asyncio.create_subprocess_exec(
+                "sudo",
+                "systemctl",
+                "restart",
+                service,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
             )
-
-            if result.returncode == 0:
+            try:
+                _, stderr = await asyncio.wait_for(proc.communicate(), timeout=30)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                raise
+
+            if proc.returncode == 0:
                 await update.message.reply_text(f"✅ {service} restarted successfully")
                 logger.info(
                     f"Service {service} restarted by {update.effective_user.username}"
                 )
             else:
+                error = stderr.decode(errors="replace")
                 await update.message.reply_text(
-                    f"❌ Failed to restart {service}: {result.stderr[:100]}"
+                    f"❌ Failed to restart {service}: {error[:100]}"
                 )
 
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             logger.error(f"Service restart timed out: {service}")
             await update.message.reply_text(f"❌ Restart timed out for {service}")
-        except (subprocess.SubprocessError, OSError) as e:
+        except OSError as e:
             logger.error(f"Service restart failed for {service}: {e}")
             await update.message.reply_text(
                 "❌ Service restart failed. Check logs for details."
@@ -452,14 +712,12 @@ class TelegramAlertBot:
         mem = psutil.virtual_memory()
         swap = psutil.swap_memory()
 
-        text = (
-            f"*Memory Usage*\n"
-            f"━━━━━━━━━━━━━━━\n"
-            f"🤖 Bot Process: {memory['used_mb']:.1f}MB\n"
-            f"📊 System RAM: {mem.percent}% used\n"
-            f"💾 Available: {mem.available / 1024 / 1024:.0f}MB\n"
-            f"🔄 Swap: {swap.percent}% used\n\n"
-            f"⚠️ Bot limit: {memory['threshold_mb']}MB\n"
+        text = _MEMORY_TEMPLATE.format(
+            bot_mb=memory["used_mb"],
+            ram_pct=mem.percent,
+            available_mb=mem.available / 1024 / 1024,
+            swap_pct=swap.percent,
+            limit_mb=memory["threshold_mb"],
         )
 
         await update.message.reply_text(text, parse_mode=ParseMode.MARKDOWN)
@@ -483,20 +741,28 @@ class TelegramAlertBot:
 
     def _get_hostname(self) -> str:
         """Get system hostname."""
-        import socket
-
-        return socket.gethostname()
+        return self._hostname
 
     def _get_cpu_temp(self) -> float:
         """Get CPU temperature."""
+        if self._temp_fd is None:
+            return 0.0
         try:
-            with open("/sys/class/thermal/thermal_zone0/temp") as f:
-                return round(float(f.read().strip()) / 1000, 1)
-        except OSError:
+            self._temp_fd.seek(0)
+            return round(float(self._temp_fd.read().strip()) / 1000, 1)
+        except (OSError, ValueError):
             return 0.0
 
-    async def run(self) -> None:
-        """Main bot runner with asyncio."""
+    async def _heartbeat(self) -> None:
+        """Periodic memory check while the bot is running."""
+        while True:
+            await asyncio.sleep(300)
+            used_mb, percent = await self.memory_manager.check_memory_fast()
+            if percent > 90:
+                logger.warning(f"High memory usage: {used_mb}MB")
+
+    async def run(self, stop_event: asyncio.Event) -> None:
+        """Main bot runner with asyncio; returns once stop_event is set."""
         self.application = (
             Application.builder()
             .token(self.config.token)
@@ -524,15 +790,17 @@ class TelegramAlertBot:
             allowed_updates=Update.ALL_TYPES, drop_pending_updates=True
         )
 
-        # Keep running with periodic memory checks
-        try:
-            while True:
-                await asyncio.sleep(300)
-                memory = await self.memory_manager.check_memory()
-                if memory["percent"] > 90:
-                    logger.warning(f"High memory usage: {memory['used_mb']}MB")
-        except asyncio.CancelledError:
-            pass
+        # Keep running with periodic memory checks until asked to stop
+        heartbeat_task = asyncio.create_task(self._heartbeat())
+        stop_task = asyncio.create_task(stop_event.wait())
+        _, pending = await asyncio.wait(
+            {heartbeat_task, stop_task}, return_when=asyncio.FIRST_COMPLETED
+        )
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        if heartbeat_task.done() and not heartbeat_task.cancelled():
+            heartbeat_task.result()  # Propagate unexpected heartbeat errors
 
     async def shutdown(self) -> None:
         """Graceful shutdown."""
@@ -541,6 +809,9 @@ class TelegramAlertBot:
             await self.application.updater.stop()
             await self.application.stop()
             await self.application.shutdown()
+        if self._temp_fd is not None:
+            self._temp_fd.close()
+            self._temp_fd = None
         logger.info("Alert bot shutdown complete")
 
 
@@ -550,11 +821,18 @@ async def async_main() -> int:
         config = BotConfig()
         bot = TelegramAlertBot(config)
 
+        # Everything needed has been copied out; let the parsed YAML go
+        _config.cache_clear()
+        _service_config.cache_clear()
+        clear_yaml_cache()
+
+        stop_event = asyncio.Event()
         loop = asyncio.get_running_loop()
         for sig in (signal.SIGTERM, signal.SIGINT):
-            loop.add_signal_handler(sig, lambda: asyncio.create_task(bot.shutdown()))
+            loop.add_signal_handler(sig, stop_event.set)
 
-        await bot.run()
+        await bot.run(stop_event)
+        await bot.shutdown()
         return 0
 
     except KeyboardInterrupt:
@@ -580,10 +858,13 @@ def main() -> int:
     except PermissionError:
         pass
 
+    log_listener = _start_log_listener()
     try:
         return asyncio.run(async_main())
     except KeyboardInterrupt:
         return 130
+    finally:
+        log_listener.stop()  # Flushes queued records to the log file
 
 
 if __name__ == "__main__":
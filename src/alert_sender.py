@@ -19,6 +19,12 @@ Usage:
     # Send metrics with severity
     python3 alert_sender.py metrics
 
+    # Send all three reports (metrics collected once, batched)
+    python3 alert_sender.py all
+
+    # Run continuously, reusing one connection
+    python3 alert_sender.py daemon --interval 60 --kinds status,metrics
+
     # Import as module
     from alert_sender import send_status_alert
 
@@ -30,43 +36,237 @@ Version: 1.0.0
 
 import asyncio
 import logging
+import os
 import sys
+import time
+from collections.abc import Callable, Coroutine
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple, TypeVar
+
+# Optional at import so the format_*_message helpers work without it
+try:
+    from telegram import Bot
+
+    HAS_TELEGRAM = True
+except ImportError:
+    HAS_TELEGRAM = False
 
 logger = logging.getLogger(__name__)
 
 # Import local modules
-try:
-    from config_loader import load_config, load_service_monitoring
-    from metrics_collector import MetricsCollector
-except ImportError:
-    sys.path.insert(0, str(Path(__file__).parent))
-    from config_loader import load_config, load_service_monitoring
-    from metrics_collector import MetricsCollector
+_SRC_DIR = str(Path(__file__).parent)
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
+
+from config_loader import load_config, load_service_monitoring
+from metrics_collector import (
+    COLLECT_INTERVALS,
+    METRIC_NAMES,
+    BackgroundCollector,
+    MetricsCollector,
+    format_ts,
+)
 
 # Load configuration
 CONFIG = load_config()
 SERVICE_CONFIG = load_service_monitoring()
 
+# Services listed in a critical/important group (the rest are "Other")
+_KNOWN_SERVICES = frozenset(SERVICE_CONFIG.get("critical_services", [])) | frozenset(
+    SERVICE_CONFIG.get("important_services", [])
+)
+
+# Static for the process lifetime, used as the header of every message
+_PREFIX: str = (CONFIG.get("bot") or {}).get("system_prefix", "[MONITOR]")
+
+# Fixed message headers, with the prefix substituted once at import
+_STATUS_HEADER = f"📊 {_PREFIX} System Status\n\n📊 Hardware:\n"
+_SERVICES_HEADER = f"🔧 {_PREFIX} Service Status\n\n"
+_METRICS_HEADER = f"📊 {_PREFIX} Hardware Metrics\n\n"
+
+_T = TypeVar("_T")
+
+# Shared across sends so repeated alerts reuse one event loop and one Bot
+# (whose HTTP client keeps its connection alive) instead of a new TLS
+# handshake per message.
+_bot: "Bot | None" = None
+_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_bot(token: str) -> "Bot":
+    """Return the shared Bot instance, creating it on first use."""
+    global _bot
+    if _bot is None:
+        _bot = Bot(token=token)
+    return _bot
+
 
-def load_credentials() -> dict[str, str]:
+def _run(coro: Coroutine[Any, Any, _T]) -> _T:
+    """Run a coroutine on the shared, persistent event loop."""
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+    return _loop.run_until_complete(coro)
+
+
+# Shutdown tasks scheduled by close() on a running loop (kept referenced
+# until done so they are not garbage collected mid-flight)
+_closing: set[asyncio.Task[None]] = set()
+
+
+def close() -> None:
+    """
+    Release the shared Bot connection and event loop.
+
+    The Bot is dropped even when no shared loop exists (daemon mode runs on
+    asyncio.run()'s loop), so the next send builds a new one.
+    """
+    global _bot, _loop
+    bot, _bot = _bot, None
+    if bot is not None:
+        # Bot.shutdown() is a no-op for a Bot that was never initialize()d,
+        # so close its HTTP client directly.
+        if _loop is not None and not _loop.is_closed():
+            _loop.run_until_complete(bot.request.shutdown())
+        else:
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                asyncio.run(bot.request.shutdown())
+            else:
+                task = running.create_task(bot.request.shutdown())
+                _closing.add(task)
+                task.add_done_callback(_closing.discard)
+    if _loop is not None:
+        _loop.close()
+        _loop = None
+
+
+# Severity ladders: (exclusive lower threshold, line template), highest first
+_CPU_LEVELS: tuple[tuple[float, str], ...] = (
+    (80, "🔥 CRITICAL CPU: {}°C\n"),
+    (70, "⚠️ WARNING CPU: {}°C\n"),
+    (float("-inf"), "🌡️ CPU: {}°C ✅\n"),
+)
+_MEMORY_LEVELS: tuple[tuple[float, str], ...] = (
+    (90, "🚨 CRITICAL Memory: {}%\n"),
+    (80, "⚠️ WARNING Memory: {}%\n"),
+    (float("-inf"), "💾 Memory: {}% ✅\n"),
+)
+_DISK_LEVELS: tuple[tuple[float, str], ...] = (
+    (95, "🚨 CRITICAL Disk: {}%\n"),
+    (85, "⚠️ WARNING Disk: {}%\n"),
+    (float("-inf"), "💽 Disk: {}% ✅\n"),
+)
+
+
+def _severity(value: float, levels: tuple[tuple[float, str], ...]) -> str:
+    """Render value with the template of the first level it exceeds."""
+    return next(tpl for threshold, tpl in levels if value > threshold).format(value)
+
+
+class Credentials(NamedTuple):
+    """Telegram bot token and target chat ID."""
+
+    token: str
+    chat_id: str
+
+
+# Per-section line formatters. Sections absent (or empty) in the metrics
+# dict are skipped without running their formatter.
+
+
+def _status_cpu(temp: float) -> str:
+    """CPU line for the status message."""
+    emoji = "🌡️" if temp < 70 else "🔥"
+    return f"{emoji} CPU: {temp}°C\n"
+
+
+def _status_memory(memory: dict[str, Any]) -> str:
+    """Memory line for the status message."""
+    pct = memory.get("percentage", 0)
+    emoji = "💾" if pct < 80 else "⚠️"
+    return f"{emoji} Memory: {pct}% used\n"
+
+
+def _status_disk(disk: dict[str, Any]) -> str:
+    """Disk line for the status message."""
+    pct = disk.get("percentage", 0)
+    emoji = "💽" if pct < 85 else "⚠️"
+    return f"{emoji} Disk: {pct}% used\n"
+
+
+def _metrics_cpu(temp: float) -> str:
+    """CPU temperature line with severity."""
+    return _severity(temp, _CPU_LEVELS)
+
+
+def _metrics_memory(memory: dict[str, Any]) -> str:
+    """Memory lines with severity and usage."""
+    line = _severity(memory.get("percentage", 0), _MEMORY_LEVELS)
+    return f"{line}   {memory.get('used_mb', 0)}/{memory.get('total_mb', 0)} MB\n"
+
+
+def _metrics_disk(disk: dict[str, Any]) -> str:
+    """Disk lines with severity and usage."""
+    line = _severity(disk.get("percentage", 0), _DISK_LEVELS)
+    return f"{line}   {disk.get('used', '?')}/{disk.get('size', '?')}\n"
+
+
+def _metrics_load(load: dict[str, Any]) -> str:
+    """Load average line."""
+    return (
+        f"\n📈 Load: {load.get('load_1min', 0):.2f} / "
+        f"{load.get('load_5min', 0):.2f} / {load.get('load_15min', 0):.2f}\n"
+    )
+
+
+_STATUS_SECTIONS: tuple[tuple[str, Callable[[Any], str]], ...] = (
+    ("cpu_temp", _status_cpu),
+    ("memory", _status_memory),
+    ("disk", _status_disk),
+)
+_METRICS_SECTIONS: tuple[tuple[str, Callable[[Any], str]], ...] = (
+    ("cpu_temp", _metrics_cpu),
+    ("memory", _metrics_memory),
+    ("disk", _metrics_disk),
+    ("load", _metrics_load),
+)
+
+
+def load_credentials() -> Credentials:
     """
     Load Telegram credentials from config or environment.
 
     Returns:
-        Dictionary with 'token' and 'chat_id'
+        Credentials with token and chat_id
     """
-    import os
-
     telegram_config = CONFIG.get("telegram", {})
 
-    return {
-        "token": os.environ.get("TELEGRAM_BOT_TOKEN")
-        or telegram_config.get("token", ""),
-        "chat_id": os.environ.get("TELEGRAM_CHAT_ID")
+    return Credentials(
+        token=os.environ.get("TELEGRAM_BOT_TOKEN") or telegram_config.get("token", ""),
+        chat_id=os.environ.get("TELEGRAM_CHAT_ID")
         or telegram_config.get("chat_id", ""),
-    }
+    )
+
+
+# Resolved once; call refresh_credentials() to pick up changes
+_CREDENTIALS = load_credentials()
+
+
+def refresh_credentials() -> None:
+    """Re-resolve credentials, e.g. after TELEGRAM_BOT_TOKEN was rotated."""
+    global _CREDENTIALS
+    credentials = load_credentials()
+    if credentials.token != _CREDENTIALS.token:
+        close()  # Shared Bot was built with the old token
+    _CREDENTIALS = credentials
+
+
+def _timestamp_footer(metrics: dict[str, Any]) -> str:
+    """Last line of a report: when its metrics were collected."""
+    timestamp = metrics.get("timestamp")
+    return f"\n📅 {format_ts(timestamp) if timestamp is not None else 'N/A'}"
 
 
 def format_status_message(metrics: dict[str, Any] | None = None) -> str:
@@ -83,41 +283,26 @@ def format_status_message(metrics: dict[str, Any] | None = None) -> str:
         collector = MetricsCollector()
         metrics = collector.collect_all_metrics()
 
-    system_name = CONFIG.get("bot", {}).get("system_name", "System")
-    prefix = CONFIG.get("bot", {}).get("system_prefix", "[MONITOR]")
-
-    message = f"📊 {prefix} System Status\n\n"
-
-    # Hardware section
-    message += "📊 Hardware:\n"
-
-    if metrics.get("cpu_temp"):
-        temp_emoji = "🌡️" if metrics["cpu_temp"] < 70 else "🔥"
-        message += f"{temp_emoji} CPU: {metrics['cpu_temp']}°C\n"
+    # Header includes the hardware section title
+    parts: list[str] = [_STATUS_HEADER]
 
-    if metrics.get("memory"):
-        mem_pct = metrics["memory"].get("percentage", 0)
-        mem_emoji = "💾" if mem_pct < 80 else "⚠️"
-        message += f"{mem_emoji} Memory: {mem_pct}% used\n"
-
-    if metrics.get("disk"):
-        disk_pct = metrics["disk"].get("percentage", 0)
-        disk_emoji = "💽" if disk_pct < 85 else "⚠️"
-        message += f"{disk_emoji} Disk: {disk_pct}% used\n"
+    parts.extend(
+        fmt(value) for key, fmt in _STATUS_SECTIONS if (value := metrics.get(key))
+    )
 
     # Services section
-    message += "\n🔧 Services:\n"
+    parts.append("\n🔧 Services:\n")
     if metrics.get("services"):
         for service, status in metrics["services"].items():
             status_emoji = "✅" if status == "active" else "❌"
-            message += f"{status_emoji} {service}: {status}\n"
+            parts.append(f"{status_emoji} {service}: {status}\n")
     else:
-        message += "  No services configured\n"
+        parts.append("  No services configured\n")
 
     # Timestamp
-    message += f"\n📅 {metrics.get('timestamp', 'N/A')}"
+    parts.append(_timestamp_footer(metrics))
 
-    return message
+    return "".join(parts)
 
 
 def format_services_message(metrics: dict[str, Any] | None = None) -> str:
@@ -134,46 +319,44 @@ def format_services_message(metrics: dict[str, Any] | None = None) -> str:
         collector = MetricsCollector()
         metrics = collector.collect_all_metrics()
 
-    prefix = CONFIG.get("bot", {}).get("system_prefix", "[MONITOR]")
-
-    message = f"🔧 {prefix} Service Status\n\n"
+    parts: list[str] = [_SERVICES_HEADER]
 
     if metrics.get("services"):
+        services = metrics["services"]
+
         # Get configured service groups
         critical = SERVICE_CONFIG.get("critical_services", [])
         important = SERVICE_CONFIG.get("important_services", [])
 
         # Critical services
         if critical:
-            message += "🚨 Critical Services:\n"
+            parts.append("🚨 Critical Services:\n")
             for svc in critical:
-                if svc in metrics["services"]:
-                    status = metrics["services"][svc]
+                if svc in services:
+                    status = services[svc]
                     emoji = "✅" if status == "active" else "❌"
-                    message += f"{emoji} {svc}: {status}\n"
+                    parts.append(f"{emoji} {svc}: {status}\n")
 
         # Important services
         if important:
-            message += "\n⚠️ Important Services:\n"
+            parts.append("\n⚠️ Important Services:\n")
             for svc in important:
-                if svc in metrics["services"]:
-                    status = metrics["services"][svc]
+                if svc in services:
+                    status = services[svc]
                     emoji = "✅" if status == "active" else "❌"
-                    message += f"{emoji} {svc}: {status}\n"
+                    parts.append(f"{emoji} {svc}: {status}\n")
 
         # Other services (not in critical or important)
-        other_services = [
-            s for s in metrics["services"] if s not in critical and s not in important
-        ]
+        other_services = [s for s in services if s not in _KNOWN_SERVICES]
         if other_services:
-            message += "\n📋 Other Services:\n"
+            parts.append("\n📋 Other Services:\n")
             for svc in other_services:
-                status = metrics["services"][svc]
+                status = services[svc]
                 emoji = "✅" if status == "active" else "❌"
-                message += f"{emoji} {svc}: {status}\n"
+                parts.append(f"{emoji} {svc}: {status}\n")
 
-    message += f"\n📅 {metrics.get('timestamp', 'N/A')}"
-    return message
+    parts.append(_timestamp_footer(metrics))
+    return "".join(parts)
 
 
 def format_metrics_message(metrics: dict[str, Any] | None = None) -> str:
@@ -190,55 +373,14 @@ def format_metrics_message(metrics: dict[str, Any] | None = None) -> str:
         collector = MetricsCollector()
         metrics = collector.collect_all_metrics()
 
-    prefix = CONFIG.get("bot", {}).get("system_prefix", "[MONITOR]")
+    parts: list[str] = [_METRICS_HEADER]
 
-    message = f"📊 {prefix} Hardware Metrics\n\n"
+    parts.extend(
+        fmt(value) for key, fmt in _METRICS_SECTIONS if (value := metrics.get(key))
+    )
 
-    # CPU Temperature with severity
-    if metrics.get("cpu_temp"):
-        temp = metrics["cpu_temp"]
-        if temp > 80:
-            message += f"🔥 CRITICAL CPU: {temp}°C\n"
-        elif temp > 70:
-            message += f"⚠️ WARNING CPU: {temp}°C\n"
-        else:
-            message += f"🌡️ CPU: {temp}°C ✅\n"
-
-    # Memory with severity
-    if metrics.get("memory"):
-        mem_pct = metrics["memory"].get("percentage", 0)
-        if mem_pct > 90:
-            message += f"🚨 CRITICAL Memory: {mem_pct}%\n"
-        elif mem_pct > 80:
-            message += f"⚠️ WARNING Memory: {mem_pct}%\n"
-        else:
-            message += f"💾 Memory: {mem_pct}% ✅\n"
-
-        used = metrics["memory"].get("used_mb", 0)
-        total = metrics["memory"].get("total_mb", 0)
-        message += f"   {used}/{total} MB\n"
-
-    # Disk with severity
-    if metrics.get("disk"):
-        disk_pct = metrics["disk"].get("percentage", 0)
-        if disk_pct > 95:
-            message += f"🚨 CRITICAL Disk: {disk_pct}%\n"
-        elif disk_pct > 85:
-            message += f"⚠️ WARNING Disk: {disk_pct}%\n"
-        else:
-            message += f"💽 Disk: {disk_pct}% ✅\n"
-
-        used = metrics["disk"].get("used", "?")
-        size = metrics["disk"].get("size", "?")
-        message += f"   {used}/{size}\n"
-
-    # Load average
-    if metrics.get("load"):
-        load = metrics["load"]
-        message += f"\n📈 Load: {load.get('load_1min', 0):.2f} / {load.get('load_5min', 0):.2f} / {load.get('load_15min', 0):.2f}\n"
-
-    message += f"\n📅 {metrics.get('timestamp', 'N/A')}"
-    return message
+    parts.append(_timestamp_footer(metrics))
+    return "".join(parts)
 
 
 async def send_telegram_message(message_text: str) -> bool:
@@ -251,9 +393,7 @@ async def send_telegram_message(message_text: str) -> bool:
     Returns:
         True if message sent successfully, False otherwise
     """
-    credentials = load_credentials()
-    token = credentials.get("token")
-    chat_id = credentials.get("chat_id")
+    token, chat_id = _CREDENTIALS
 
     # Log credential status without exposing values
     token_status = "loaded" if token else "MISSING"
@@ -264,10 +404,12 @@ async def send_telegram_message(message_text: str) -> bool:
         logger.error("Missing credentials - cannot send message")
         return False
 
-    try:
-        from telegram import Bot
+    if not HAS_TELEGRAM:
+        logger.error("python-telegram-bot not installed - cannot send message")
+        return False
 
-        bot = Bot(token=token)
+    try:
+        bot = _get_bot(token)
         result = await bot.send_message(chat_id=chat_id, text=message_text)
         logger.info(f"Message sent successfully - ID {result.message_id}")
         return True
@@ -276,65 +418,273 @@ async def send_telegram_message(message_text: str) -> bool:
         return False
 
 
-def send_status_alert(metrics: dict[str, Any] | None = None) -> bool:
+# Telegram rejects messages longer than this many characters
+TELEGRAM_MESSAGE_LIMIT = 4096
+_BATCH_SEPARATOR = "\n\n---\n\n"
+
+
+class AlertBatcher:
+    """Buffers alert texts and sends them joined into as few messages as possible."""
+
+    __slots__ = ["_buffer", "_first_queued", "_flush_interval"]
+
+    def __init__(self, flush_interval: float = 10) -> None:
+        self._buffer: list[str] = []
+        self._first_queued = 0.0
+        self._flush_interval = flush_interval
+
+    def enqueue(self, text: str) -> None:
+        """Add an alert text to the buffer."""
+        if not self._buffer:
+            self._first_queued = time.monotonic()
+        self._buffer.append(text)
+
+    def is_due(self) -> bool:
+        """Return True if the oldest buffered alert exceeded the flush interval."""
+        return (
+            bool(self._buffer)
+            and time.monotonic() - self._first_queued >= self._flush_interval
+        )
+
+    def _pack(self) -> list[str]:
+        """Join buffered texts into messages within the Telegram length limit."""
+        messages: list[str] = []
+        current: list[str] = []
+        total = 0
+        for text in self._buffer:
+            extra = len(text) + (len(_BATCH_SEPARATOR) if current else 0)
+            if current and total + extra > TELEGRAM_MESSAGE_LIMIT:
+                messages.append(_BATCH_SEPARATOR.join(current))
+                current, total = [], 0
+                extra = len(text)
+            current.append(text)
+            total += extra
+        if current:
+            messages.append(_BATCH_SEPARATOR.join(current))
+        return messages
+
+    async def flush(self) -> bool:
+        """
+        Send all buffered alerts.
+
+        Returns:
+            True if every message was sent successfully (or nothing was queued)
+        """
+        messages = self._pack()
+        self._buffer = []
+        success = True
+        for message in messages:
+            success = await send_telegram_message(message) and success
+        return success
+
+
+_batcher = AlertBatcher((CONFIG.get("telegram") or {}).get("batch_flush_interval", 10))
+
+
+def _send_or_enqueue(message: str, batch: bool) -> bool:
+    """Send a message now, or buffer it when batching is requested."""
+    if not batch:
+        return _run(send_telegram_message(message))
+    _batcher.enqueue(message)
+    if _batcher.is_due():
+        return flush_alerts()
+    return True
+
+
+def flush_alerts() -> bool:
+    """
+    Send all alerts buffered via ``batch=True``.
+
+    Returns:
+        True if sent successfully (or nothing was queued)
+    """
+    return _run(_batcher.flush())
+
+
+def send_status_alert(
+    metrics: dict[str, Any] | None = None, *, batch: bool = False
+) -> bool:
     """
     Send system status alert.
 
     Args:
         metrics: Pre-collected metrics, or None to collect fresh
+        batch: Buffer the message (see flush_alerts) instead of sending now
 
     Returns:
-        True if sent successfully
+        True if sent (or queued) successfully
     """
     message = format_status_message(metrics)
-    return asyncio.run(send_telegram_message(message))
+    return _send_or_enqueue(message, batch)
 
 
-def send_services_alert(metrics: dict[str, Any] | None = None) -> bool:
+def send_services_alert(
+    metrics: dict[str, Any] | None = None, *, batch: bool = False
+) -> bool:
     """
     Send service health alert.
 
     Args:
         metrics: Pre-collected metrics, or None to collect fresh
+        batch: Buffer the message (see flush_alerts) instead of sending now
 
     Returns:
-        True if sent successfully
+        True if sent (or queued) successfully
     """
     message = format_services_message(metrics)
-    return asyncio.run(send_telegram_message(message))
+    return _send_or_enqueue(message, batch)
 
 
-def send_metrics_alert(metrics: dict[str, Any] | None = None) -> bool:
+def send_metrics_alert(
+    metrics: dict[str, Any] | None = None, *, batch: bool = False
+) -> bool:
     """
     Send hardware metrics alert.
 
     Args:
         metrics: Pre-collected metrics, or None to collect fresh
+        batch: Buffer the message (see flush_alerts) instead of sending now
 
     Returns:
-        True if sent successfully
+        True if sent (or queued) successfully
     """
     message = format_metrics_message(metrics)
-    return asyncio.run(send_telegram_message(message))
+    return _send_or_enqueue(message, batch)
+
+
+def send_all_alerts(metrics: dict[str, Any] | None = None) -> bool:
+    """
+    Send status, services and metrics reports from a single collection.
+
+    Metrics are collected once and the three reports are batched into as
+    few Telegram messages as possible.
+
+    Args:
+        metrics: Pre-collected metrics, or None to collect fresh
+
+    Returns:
+        True if sent successfully
+    """
+    if metrics is None:
+        metrics = MetricsCollector().collect_all_metrics()
+
+    queued = [
+        send_status_alert(metrics, batch=True),
+        send_services_alert(metrics, batch=True),
+        send_metrics_alert(metrics, batch=True),
+    ]
+    return flush_alerts() and all(queued)
+
+
+_FORMATTERS: dict[str, Callable[[dict[str, Any] | None], str]] = {
+    "status": format_status_message,
+    "services": format_services_message,
+    "metrics": format_metrics_message,
+}
+
+
+async def daemon(interval: float, kinds: list[str]) -> None:
+    """
+    Send the selected reports every ``interval`` seconds until cancelled.
+
+    Keeps one MetricsCollector and the shared Bot connection for the whole
+    run. Metrics are collected on a background thread, so a slow probe
+    never holds up the event loop; each cycle formats the latest snapshot
+    and sends all reports batched.
+
+    Args:
+        interval: Seconds between report cycles
+        kinds: Report types to send (keys of _FORMATTERS)
+    """
+    global _bot
+    # Reports go out every `interval` seconds, so collecting any metric more
+    # often than that would only be extra work on the device
+    collector = BackgroundCollector(
+        MetricsCollector(),
+        {
+            metric: max(COLLECT_INTERVALS.get(metric, 0), interval)
+            for metric in METRIC_NAMES
+        },
+    )
+    collector.start()
+    formatters = [_FORMATTERS[kind] for kind in kinds]
+
+    try:
+        # Only the first cycle waits for a collection
+        await asyncio.to_thread(collector.wait_ready, interval)
+        while True:
+            metrics = collector.snapshot()
+            for formatter in formatters:
+                _batcher.enqueue(formatter(metrics))
+            await _batcher.flush()
+            await asyncio.sleep(interval)
+    finally:
+        collector.stop()
+        if _bot is not None:
+            await _bot.request.shutdown()
+            _bot = None
+
+
+def _run_daemon(argv: list[str]) -> int:
+    """Parse daemon arguments and run until interrupted."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="alert_sender.py daemon", description="Send reports periodically"
+    )
+    parser.add_argument(
+        "--interval",
+        "-i",
+        type=float,
+        default=60,
+        help="Seconds between reports (default: 60)",
+    )
+    parser.add_argument(
+        "--kinds",
+        "-k",
+        default="status",
+        help="Comma-separated reports: status,services,metrics (default: status)",
+    )
+    args = parser.parse_args(argv)
+
+    kinds = [k.strip().lower() for k in args.kinds.split(",") if k.strip()]
+    unknown = [k for k in kinds if k not in _FORMATTERS]
+    if unknown or not kinds:
+        parser.error(f"invalid --kinds: {args.kinds}")
+
+    try:
+        asyncio.run(daemon(args.interval, kinds))
+    except KeyboardInterrupt:
+        return 130
+    return 0
 
 
 def main() -> int:
     """Main entry point for CLI usage."""
     if len(sys.argv) < 2:
-        print("Usage: python3 alert_sender.py [status|services|metrics]")
+        print("Usage: python3 alert_sender.py [status|services|metrics|all|daemon]")
         return 1
 
     command = sys.argv[1].lower()
 
-    if command == "status":
-        success = send_status_alert()
-    elif command == "services":
-        success = send_services_alert()
-    elif command == "metrics":
-        success = send_metrics_alert()
-    else:
-        print("Available commands: status, services, metrics")
-        return 1
+    if command == "daemon":
+        return _run_daemon(sys.argv[2:])
+
+    try:
+        if command == "status":
+            success = send_status_alert()
+        elif command == "services":
+            success = send_services_alert()
+        elif command == "metrics":
+            success = send_metrics_alert()
+        elif command == "all":
+            success = send_all_alerts()
+        else:
+            print("Available commands: status, services, metrics, all, daemon")
+            return 1
+    finally:
+        flush_alerts()
+        close()
 
     return 0 if success else 1
 
@@ -20,14 +20,24 @@ Environment Variables:
     LOG_LEVEL: Override log level (DEBUG, INFO, WARNING, ERROR)
 """
 
-import copy
+import functools
 import logging
 import os
+import pickle
+import stat
+from collections.abc import Callable, Iterable, Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 import yaml
 
+# Prefer the libyaml C parser when available (several times faster)
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 # Default configuration values
@@ -42,6 +52,7 @@ DEFAULTS: dict[str, Any] = {
         "chat_id": "",
         "admin_ids": [],
         "rate_limit_window": 60,
+        "batch_flush_interval": 10,
     },
     "monitoring": {
         "interfaces": [],
@@ -66,15 +77,67 @@ DEFAULTS: dict[str, Any] = {
         "connect_timeout": 10,
         "command_timeout": 15,
         "max_retries": 3,
+        "max_retry_delay": 10,
+        "control_persist": "60s",
+        "control_path": "/tmp/ssh-telegram-monitor-%C",
     },
     "memory": {
         "limit_mb": 50,
         "gc_interval": 300,
         "threshold_mb": 45,
     },
+    "metrics": {
+        "intervals": {
+            "cpu_temp": 5,
+            "memory": 5,
+            "disk": 60,
+            "load": 5,
+            "services": 30,
+        },
+        "cache_ttl": {
+            "cpu_temp": 5,
+            "memory": 2,
+            "disk": 30,
+            "load": 2,
+            "services": 10,
+        },
+    },
+}
+
+# Service monitoring defaults, shared read-only when no file is present
+_SERVICE_DEFAULTS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "critical_services": (),
+        "important_services": (),
+        "allowed_restart": (),
+    }
+)
+
+# Pickled once: unpickling yields a fresh nested copy several times faster
+# than copy.deepcopy (DEFAULTS is plain data).
+_DEFAULTS_PICKLE = pickle.dumps(DEFAULTS)
+
+# Environment variables overriding config keys: env var -> (section, key)
+_ENV_OVERRIDES: dict[str, tuple[str, str]] = {
+    "TELEGRAM_BOT_TOKEN": ("telegram", "token"),
+    "TELEGRAM_CHAT_ID": ("telegram", "chat_id"),
+    "TELEGRAM_ADMIN_IDS": ("telegram", "admin_ids"),
+    "LOG_LEVEL": ("bot", "log_level"),
+}
+
+
+def _parse_csv_list(value: str) -> list[str]:
+    """Parse a comma-separated environment value into a list."""
+    return [v.strip() for v in value.split(",") if v.strip()]
+
+
+# Converters for override values that are not plain strings, keyed by config key
+_ENV_PARSERS: dict[str, Callable[[str], Any]] = {
+    "admin_ids": _parse_csv_list,
 }
 
 
+@functools.lru_cache(maxsize=1)
 def get_config_dir() -> Path:
     """
     Get configuration directory from environment or default locations.
@@ -85,6 +148,8 @@ def get_config_dir() -> Path:
         3. /etc/telegram-monitor/
         4. ~/.config/telegram-monitor/
 
+    The result is cached for the process lifetime.
+
     Returns:
         Path to configuration directory
     """
@@ -101,30 +166,67 @@ def get_config_dir() -> Path:
     ]
 
     for loc in locations:
-        if loc.exists() and loc.is_dir():
-            return loc
+        # One stat() per candidate instead of exists() + is_dir()
+        try:
+            if stat.S_ISDIR(os.stat(loc).st_mode):
+                return loc
+        except OSError:
+            continue
 
     # Return first option even if doesn't exist (for creation)
     return locations[0]
 
 
-def deep_merge(base: dict, override: dict) -> dict:
+@functools.lru_cache(maxsize=16)
+def _load_yaml_cached(path: Path, mtime_ns: int) -> bytes:
+    """Parse a YAML file; cached (pickled) per (path, mtime) so edits invalidate it."""
+    with open(path, "rb") as f:
+        return pickle.dumps(yaml.load(f, Loader=_YamlLoader) or {})
+
+
+def _load_yaml(path: Path) -> Any:
+    """
+    Load a YAML file, reusing the parsed result while the file is unchanged.
+
+    Args:
+        path: Path to an existing YAML file
+
+    Returns:
+        Fresh copy of the parsed data (callers may mutate it freely)
+    """
+    return pickle.loads(_load_yaml_cached(path, path.stat().st_mtime_ns))
+
+
+def clear_yaml_cache() -> None:
+    """Drop all cached YAML parses (later loads re-read the files)."""
+    _load_yaml_cached.cache_clear()
+
+
+def deep_merge(base: dict, override: dict, *, in_place: bool = False) -> dict:
     """
     Deep merge two dictionaries, with override taking precedence.
 
     Args:
         base: Base dictionary with defaults
         override: Override dictionary with user values
+        in_place: Mutate base directly instead of copying the merged levels
 
     Returns:
-        Merged dictionary
+        Merged dictionary (base itself if in_place)
     """
-    result = base.copy()
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge(result[key], value)
-        else:
-            result[key] = value
+    result = base if in_place else base.copy()
+    # Explicit stack instead of recursion: (target level, override level)
+    stack = [(result, override)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                if not in_place:
+                    current = target[key] = current.copy()
+                stack.append((current, value))
+            else:
+                target[key] = value
     return result
 
 
@@ -143,8 +245,8 @@ def load_config(config_file: Path | None = None) -> dict[str, Any]:
         FileNotFoundError: If config file specified but not found
         yaml.YAMLError: If config file has invalid YAML syntax
     """
-    # Use deepcopy to avoid mutating DEFAULTS (nested dicts)
-    config = copy.deepcopy(DEFAULTS)
+    # Fresh nested copy so merging never mutates DEFAULTS
+    config: dict[str, Any] = pickle.loads(_DEFAULTS_PICKLE)
 
     # Determine config file path
     if config_file is None:
@@ -154,30 +256,17 @@ def load_config(config_file: Path | None = None) -> dict[str, Any]:
     # Load from file if exists
     if config_file.exists():
         logger.info(f"Loading configuration from {config_file}")
-        with open(config_file, "r") as f:
-            file_config = yaml.safe_load(f) or {}
-        config = deep_merge(config, file_config)
+        file_config = _load_yaml(config_file)
+        deep_merge(config, file_config, in_place=True)
     else:
         logger.warning(f"Config file not found: {config_file}, using defaults")
 
     # Environment variable overrides (highest priority)
-    env_overrides = {
-        "TELEGRAM_BOT_TOKEN": ("telegram", "token"),
-        "TELEGRAM_CHAT_ID": ("telegram", "chat_id"),
-        "TELEGRAM_ADMIN_IDS": ("telegram", "admin_ids"),
-        "LOG_LEVEL": ("bot", "log_level"),
-    }
-
-    for env_var, path in env_overrides.items():
+    for env_var, (section, key) in _ENV_OVERRIDES.items():
         value = os.environ.get(env_var)
         if value:
-            if path[1] == "admin_ids":
-                # Parse comma-separated list
-                value = [v.strip() for v in value.split(",") if v.strip()]
-            # Navigate to nested key and set value
-            section = config.get(path[0], {})
-            section[path[1]] = value
-            config[path[0]] = section
+            parser = _ENV_PARSERS.get(key)
+            config.setdefault(section, {})[key] = parser(value) if parser else value
             logger.debug(f"Config override from {env_var}")
 
     return config
@@ -201,13 +290,12 @@ def load_ssh_targets(config_file: Path | None = None) -> list[dict[str, Any]]:
         logger.warning(f"SSH targets file not found: {config_file}")
         return []
 
-    with open(config_file, "r") as f:
-        data = yaml.safe_load(f) or {}
+    data = _load_yaml(config_file)
 
     return data.get("targets", [])
 
 
-def load_service_monitoring(config_file: Path | None = None) -> dict[str, Any]:
+def load_service_monitoring(config_file: Path | None = None) -> Mapping[str, Any]:
     """
     Load service monitoring configuration.
 
@@ -215,26 +303,48 @@ def load_service_monitoring(config_file: Path | None = None) -> dict[str, Any]:
         config_file: Optional explicit path to service_monitoring.yml
 
     Returns:
-        Dictionary with critical_services, important_services, allowed_restart lists
+        Read-only mapping with critical_services, important_services and
+        allowed_restart as tuples (the shared empty defaults if the file is
+        missing)
     """
     if config_file is None:
         config_dir = get_config_dir()
         config_file = config_dir / "service_monitoring.yml"
 
-    defaults = {
-        "critical_services": [],
-        "important_services": [],
-        "allowed_restart": [],
-    }
-
     if not config_file.exists():
         logger.warning(f"Service monitoring file not found: {config_file}")
-        return defaults
+        return _SERVICE_DEFAULTS
 
-    with open(config_file, "r") as f:
-        data = yaml.safe_load(f) or {}
+    data = _load_yaml(config_file)
 
-    return deep_merge(defaults, data)
+    # File values replace the defaults; lists become tuples so callers get the
+    # same read-only types as the missing-file path
+    merged = deep_merge(dict(_SERVICE_DEFAULTS), data, in_place=True)
+    return MappingProxyType(
+        {
+            key: tuple(value) if isinstance(value, list) else value
+            for key, value in merged.items()
+        }
+    )
+
+
+def parse_admin_ids(values: Iterable[Any]) -> frozenset[int]:
+    """
+    Convert configured admin IDs to Telegram user ids.
+
+    Args:
+        values: IDs from the config file or TELEGRAM_ADMIN_IDS
+
+    Returns:
+        Set of integer user ids (invalid entries are logged and skipped)
+    """
+    admin_ids = set()
+    for value in values:
+        try:
+            admin_ids.add(int(str(value).strip()))
+        except ValueError:
+            logger.warning(f"Ignoring invalid admin ID: {value!r}")
+    return frozenset(admin_ids)
 
 
 def validate_config(config: dict[str, Any]) -> list[str]:
@@ -258,7 +368,8 @@ def validate_config(config: dict[str, Any]) -> list[str]:
 
     # Token format validation
     token = telegram.get("token", "")
-    if token and ":" not in token:
+    bot_id, sep, secret = token.partition(":")
+    if token and not (sep and bot_id.isdigit() and secret):
         errors.append("telegram.token format invalid (expected: <bot_id>:<secret>)")
 
     return errors
@@ -290,13 +401,24 @@ def mask_sensitive(config: dict[str, Any]) -> dict[str, Any]:
 
 if __name__ == "__main__":
     # CLI test mode
-    import json
+    # orjson is optional (faster C serializer); fall back to stdlib json
+    try:
+        import orjson
+
+        def _dumps(obj: Any) -> str:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+    except ImportError:
+        import json
+
+        def _dumps(obj: Any) -> str:
+            return json.dumps(obj, indent=2)
 
     logging.basicConfig(level=logging.DEBUG)
 
     config = load_config()
     print("=== Configuration (masked) ===")
-    print(json.dumps(mask_sensitive(config), indent=2))
+    print(_dumps(mask_sensitive(config)))
 
     errors = validate_config(config)
     if errors:
@@ -0,0 +1,40 @@
+# SPDX-License-Identifier: MIT
+# SPDX-FileCopyrightText: 2025 telegram-multi-device-monitor contributors
+"""
+Gunicorn configuration for the Prometheus webhook receiver.
+
+Usage:
+    gunicorn -c src/gunicorn.conf.py --chdir src prometheus_webhook:app
+
+Runs a single gthread worker: alert deduplication state lives in the
+worker process, so more worker processes would each keep their own copy
+and could send the same alert twice. Concurrency comes from threads.
+
+Environment Variables:
+    FLASK_HOST: Bind address (default: 127.0.0.1)
+    FLASK_PORT: Port number (default: 9094)
+    WEBHOOK_THREADS: Request threads (default: 4)
+"""
+
+import os
+from typing import Any
+
+host = os.environ.get("FLASK_HOST", "127.0.0.1")
+port = os.environ.get("FLASK_PORT", "9094")
+
+bind = f"{host}:{port}"
+workers = 1
+worker_class = "gthread"
+threads = int(os.environ.get("WEBHOOK_THREADS", "4"))
+timeout = 60
+
+# Log to stdout/stderr (journald under systemd)
+accesslog = "-"
+errorlog = "-"
+
+
+def worker_exit(server: Any, worker: Any) -> None:
+    """Persist alert state still waiting for the debounced flush."""
+    import prometheus_webhook
+
+    prometheus_webhook.flush_alert_state()
@@ -32,16 +32,20 @@ Version: 1.0.0
 """
 
 import asyncio
+import json
 import logging
 import logging.handlers
 import os
-import re
 import signal
 import socket
+import string
 import subprocess
 import sys
+import time
 from collections import deque
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timezone
+from io import TextIOWrapper
 from pathlib import Path
 from typing import Any
 
@@ -55,14 +59,25 @@ from telegram.ext import (
     ContextTypes,
 )
 
-# Import local config loader
+# Try to import pyroute2 (optional, netlink route lookup without forking ip)
 try:
-    from config_loader import load_config, load_service_monitoring, validate_config
+    from pyroute2 import AsyncIPRoute, NetlinkError  # type: ignore[import-not-found]
+
+    HAS_PYROUTE2 = True
 except ImportError:
-    # Handle case when running from different directory
-    sys.path.insert(0, str(Path(__file__).parent))
-    from config_loader import load_config, load_service_monitoring, validate_config
+    HAS_PYROUTE2 = False
 
+# Import local config loader
+_SRC_DIR = str(Path(__file__).parent)
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
+
+from config_loader import (
+    load_config,
+    load_service_monitoring,
+    parse_admin_ids,
+    validate_config,
+)
 
 # ===== Configuration =====
 CONFIG = load_config()
@@ -75,6 +90,15 @@ DOCKER_TIMEOUT = CONFIG.get("timeouts", {}).get("docker", 10)
 ROUTE_CHECK_TIMEOUT = CONFIG.get("timeouts", {}).get("route_check", 10)
 PING_TIMEOUT = CONFIG.get("timeouts", {}).get("ping", 8)
 
+# CPU temperature in millidegrees (Linux generic)
+THERMAL_ZONE_PATH = "/sys/class/thermal/thermal_zone0/temp"
+
+# Docker Engine API socket (queried directly instead of forking the CLI)
+DOCKER_SOCKET = "/var/run/docker.sock"
+
+# Progress bar for /metrics: BAR[10 - n : 20 - n] is n filled of 10 cells
+BAR = "█" * 10 + "░" * 10
+
 # Rate Limiting
 RATE_LIMIT_WINDOW = CONFIG.get("telegram", {}).get("rate_limit_window", 60)
 
@@ -83,13 +107,26 @@ LOG_CONFIG = CONFIG.get("logging", {})
 LOG_MAX_BYTES = LOG_CONFIG.get("max_bytes", 10 * 1024 * 1024)
 LOG_BACKUP_COUNT = LOG_CONFIG.get("backup_count", 3)
 LOG_DIR = Path(LOG_CONFIG.get("log_dir", "/var/log/telegram-monitor"))
+LOG_FALLBACK_DIR = Path("/tmp/telegram-monitor")
+
+
+class LazyRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Rotating file handler that creates its log directory on first write.
+
+    Used with delay=True so importing the module touches no files. Falls
+    back to LOG_FALLBACK_DIR if the configured directory is not writable.
+    """
+
+    def _open(self) -> TextIOWrapper:
+        try:
+            Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+            return super()._open()
+        except OSError:
+            LOG_FALLBACK_DIR.mkdir(parents=True, exist_ok=True)
+            self.baseFilename = str(LOG_FALLBACK_DIR / Path(self.baseFilename).name)
+            return super()._open()
 
-# Create log directory if possible
-try:
-    LOG_DIR.mkdir(parents=True, exist_ok=True)
-except PermissionError:
-    LOG_DIR = Path("/tmp/telegram-monitor")
-    LOG_DIR.mkdir(parents=True, exist_ok=True)
 
 # Logging setup
 LOG_LEVEL = os.getenv("LOG_LEVEL", CONFIG.get("bot", {}).get("log_level", "INFO"))
@@ -98,10 +135,11 @@ logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s",
     handlers=[
         logging.StreamHandler(),
-        logging.handlers.RotatingFileHandler(
+        LazyRotatingFileHandler(
             LOG_DIR / "bot.log",
             maxBytes=LOG_MAX_BYTES,
             backupCount=LOG_BACKUP_COUNT,
+            delay=True,
         ),
     ],
 )
@@ -109,7 +147,10 @@ logger = logging.getLogger(__name__)
 
 # Monitoring configuration (from service_monitoring.yml)
 CRITICAL_SERVICES = SERVICE_CONFIG.get("critical_services", [])
-ALLOWED_SERVICES = SERVICE_CONFIG.get("allowed_restart", []) + CRITICAL_SERVICES
+ALLOWED_SERVICES = [*SERVICE_CONFIG.get("allowed_restart", []), *CRITICAL_SERVICES]
+# Set for whitelist checks, sorted copy for display
+ALLOWED_SERVICES_SET = frozenset(ALLOWED_SERVICES)
+ALLOWED_SERVICES_SORTED = sorted(ALLOWED_SERVICES_SET)
 
 # Network interfaces (from config or auto-detect)
 MONITORED_INTERFACES = CONFIG.get("monitoring", {}).get("interfaces", [])
@@ -121,10 +162,21 @@ if not MONITORED_INTERFACES:
         ]
     except (OSError, AttributeError):
         MONITORED_INTERFACES = ["eth0"]
+MONITORED_INTERFACES_SET = frozenset(MONITORED_INTERFACES)
+
+# Inline keyboard callback data for restart confirmation
+RESTART_CONFIRM_PREFIX = "restart_confirm_"
+_RESTART_CONFIRM_PREFIX_LEN = len(RESTART_CONFIRM_PREFIX)
 
-# Security: Valid systemd service name pattern
+# Security: Valid systemd service name characters
 # Allows alphanumeric, underscore, hyphen, dot, and @ (for template instances)
-SERVICE_NAME_PATTERN = re.compile(r"^[a-zA-Z0-9_@.-]+\.?[a-zA-Z0-9_@.-]*$")
+SERVICE_NAME_CHARS = string.ascii_letters + string.digits + "_@.-"
+_SERVICE_NAME_DELETE = str.maketrans("", "", SERVICE_NAME_CHARS)
+
+
+def is_valid_service_name(name: str) -> bool:
+    """Check that a service name is non-empty and uses only allowed characters."""
+    return bool(name) and not name.translate(_SERVICE_NAME_DELETE)
 
 
 class BotConfig:
@@ -133,7 +185,7 @@ class BotConfig:
     def __init__(self) -> None:
         self.token: str | None = None
         self.chat_id: str | None = None
-        self.admin_ids: set[str] = set()
+        self.admin_ids: frozenset[int] = frozenset()
 
         # System identity (configurable)
         bot_config = CONFIG.get("bot", {})
@@ -165,10 +217,10 @@ class BotConfig:
         # Admin IDs
         env_admin_ids = os.environ.get("TELEGRAM_ADMIN_IDS")
         if env_admin_ids:
-            self.admin_ids = set(env_admin_ids.split(","))
+            admin_list = [aid for aid in env_admin_ids.split(",") if aid.strip()]
         else:
             admin_list = telegram_config.get("admin_ids", [])
-            self.admin_ids = set(str(aid) for aid in admin_list)
+        self.admin_ids = parse_admin_ids(admin_list)
 
         # Validation with secure logging
         if not self.token:
@@ -190,32 +242,117 @@ class BotConfig:
 class SystemMonitor:
     """System monitoring utilities with graceful degradation."""
 
+    def __init__(self) -> None:
+        self._status_cache: tuple[float, dict[str, Any]] | None = None
+        # Temperature source that worked last, and the last (monotonic, celsius)
+        self._temp_method: Callable[[], Awaitable[float | None]] | None = None
+        self._temp_cache: tuple[float, float] | None = None
+        self._status_lock = asyncio.Lock()
+        # Prime psutil so the first non-blocking sample has a baseline
+        psutil.cpu_percent(interval=None)
+        self._last_cpu = 0.0
+
+    async def sample_cpu(self, interval: float = 2.0) -> None:
+        """
+        Keep the CPU reading fresh without blocking status requests.
+
+        Args:
+            interval: Seconds between samples
+        """
+        while True:
+            await asyncio.sleep(interval)
+            self._last_cpu = psutil.cpu_percent(interval=None)
+
     @staticmethod
-    def get_system_status() -> dict[str, Any]:
+    async def _run_command(cmd: list[str], timeout: float) -> tuple[int, str]:
         """
-        Get comprehensive system status with graceful degradation.
+        Run a command without blocking the event loop.
 
-        Returns partial data if individual checks fail. Never crashes.
+        Args:
+            cmd: Command and arguments
+            timeout: Seconds to wait before the process is killed
 
         Returns:
-            dict with guaranteed structure including 'timestamp', 'healthy',
-            and various system metrics (with None/defaults on errors)
+            Tuple of (returncode, stdout)
+
+        Raises:
+            OSError: If the command cannot be started
+            subprocess.TimeoutExpired: If the command exceeds the timeout
         """
-        status: dict[str, Any] = {
-            "timestamp": datetime.now(timezone.utc).isoformat() + "Z",
-            "healthy": True,
-        }
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise subprocess.TimeoutExpired(cmd, timeout) from None
+        return proc.returncode or 0, stdout.decode(errors="replace")
+
+    @staticmethod
+    async def tail_command(cmd: list[str], lines: int, timeout: float) -> list[str]:
+        """
+        Run a command and keep only the last lines of its output.
+
+        Stdout is streamed into a bounded deque, so memory use stays at
+        `lines` no matter how much the command prints.
+
+        Args:
+            cmd: Command and arguments
+            lines: Number of trailing lines to keep
+            timeout: Seconds to wait before the process is killed
+
+        Returns:
+            Last `lines` lines of stdout, without trailing newlines
+
+        Raises:
+            OSError: If the command cannot be started
+            subprocess.TimeoutExpired: If the command exceeds the timeout
+        """
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        tail: deque[str] = deque(maxlen=lines)
 
-        # CPU and Memory
+        async def read() -> None:
+            if proc.stdout is not None:
+                async for raw in proc.stdout:
+                    tail.append(raw.decode(errors="replace").rstrip("\n"))
+            await proc.wait()
+
+        try:
+            await asyncio.wait_for(read(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise subprocess.TimeoutExpired(cmd, timeout) from None
+        return list(tail)
+
+    @staticmethod
+    def _get_resource_status() -> dict[str, Any]:
+        """
+        Collect memory, disk and interface data via psutil.
+
+        Reads /proc and statfs synchronously, so callers run it in a thread.
+
+        Returns:
+            dict with resource metrics and a 'healthy' flag
+        """
+        status: dict[str, Any] = {"healthy": True}
+
+        # Memory
         try:
-            status["cpu_percent"] = psutil.cpu_percent(interval=1)
             memory = psutil.virtual_memory()
             status["memory_percent"] = memory.percent
             status["memory_used_gb"] = memory.used / (1024**3)
             status["memory_total_gb"] = memory.total / (1024**3)
         except OSError as e:
-            logger.warning(f"CPU/Memory check failed: {e}")
-            status["cpu_percent"] = 0.0
+            logger.warning(f"Memory check failed: {e}")
             status["memory_percent"] = 0.0
             status["memory_used_gb"] = 0.0
             status["memory_total_gb"] = 0.0
@@ -238,9 +375,9 @@ class SystemMonitor:
         interfaces: dict[str, str] = {}
         try:
             for iface, addrs in psutil.net_if_addrs().items():
-                if iface in MONITORED_INTERFACES:
+                if iface in MONITORED_INTERFACES_SET:
                     for addr in addrs:
-                        if hasattr(socket, "AF_INET") and addr.family == socket.AF_INET:
+                        if addr.family == socket.AF_INET:
                             interfaces[iface] = addr.address
                             break
         except OSError as e:
@@ -248,73 +385,199 @@ class SystemMonitor:
             status["healthy"] = False
         status["interfaces"] = interfaces
 
+        return status
+
+    async def get_system_status(self, ttl: float = 3.0) -> dict[str, Any]:
+        """
+        Get system status, reusing a recent sample.
+
+        Concurrent callers wait on the same collection instead of each
+        forking their own checks.
+
+        Args:
+            ttl: Seconds a collected status stays valid
+
+        Returns:
+            Status dict as produced by _collect_system_status()
+        """
+        async with self._status_lock:
+            now = time.monotonic()
+            if self._status_cache and now - self._status_cache[0] < ttl:
+                return self._status_cache[1]
+            status = await self._collect_system_status()
+            self._status_cache = (time.monotonic(), status)
+            return status
+
+    async def _collect_system_status(self) -> dict[str, Any]:
+        """
+        Get comprehensive system status with graceful degradation.
+
+        All subprocess checks and the psutil sample run concurrently, so
+        the call takes as long as the slowest check rather than their sum.
+        Returns partial data if individual checks fail. Never crashes.
+
+        Returns:
+            dict with guaranteed structure including 'timestamp', 'healthy',
+            and various system metrics (with None/defaults on errors)
+        """
+        status: dict[str, Any] = {
+            "timestamp": datetime.now(timezone.utc).isoformat() + "Z",
+            "cpu_percent": self._last_cpu,
+        }
+
+        resources, temperature, docker_result, current_wan, services_result = (
+            await asyncio.gather(
+                asyncio.to_thread(SystemMonitor._get_resource_status),
+                self._get_temperature(),
+                SystemMonitor._get_docker_status(),
+                SystemMonitor._get_current_wan(),
+                # One systemctl call reports every unit, one state per line
+                SystemMonitor._run_command(
+                    ["systemctl", "is-active", *CRITICAL_SERVICES],
+                    HARDWARE_QUERY_TIMEOUT,
+                ),
+                return_exceptions=True,
+            )
+        )
+
+        # Memory, disk and network interfaces
+        if isinstance(resources, BaseException):
+            logger.warning(f"Resource check failed: {resources}")
+            resources = {"healthy": False, "interfaces": {}}
+        status.update(resources)
+
         # Temperature (platform-specific)
-        status["temperature"] = SystemMonitor._get_temperature()
+        status["temperature"] = (
+            0.0 if isinstance(temperature, BaseException) else temperature
+        )
 
         # Service status
         services: dict[str, bool] = {}
-        try:
-            for service in CRITICAL_SERVICES:
-                result = subprocess.run(
-                    ["systemctl", "is-active", service],
-                    capture_output=True,
-                    text=True,
-                    timeout=HARDWARE_QUERY_TIMEOUT,
-                    check=False,
-                )
-                services[service] = result.stdout.strip() == "active"
-        except (subprocess.SubprocessError, OSError) as e:
-            logger.warning(f"Service check failed: {e}")
+        if isinstance(services_result, BaseException):
+            logger.warning(f"Service check failed: {services_result}")
             status["healthy"] = False
+        else:
+            # Exit code is non-zero if any unit is inactive, so only parse stdout
+            # and pad missing lines (e.g. no D-Bus) so those units read inactive
+            states = services_result[1].splitlines()
+            states += [""] * (len(CRITICAL_SERVICES) - len(states))
+            for service, state in zip(CRITICAL_SERVICES, states):
+                services[service] = state.strip() == "active"
         status["services"] = services
 
         # Docker containers
-        docker_status: list[dict[str, Any]] = []
-        try:
-            result = subprocess.run(
-                ["docker", "ps", "--format", "{{.Names}}:{{.Status}}"],
-                capture_output=True,
-                text=True,
-                timeout=DOCKER_TIMEOUT,
-                check=False,
-            )
-            if result.returncode == 0:
-                for line in result.stdout.strip().split("\n"):
-                    if line:
-                        parts = line.split(":", 1)
-                        if len(parts) == 2:
-                            name, container_status = parts
-                            docker_status.append(
-                                {"name": name, "running": "Up" in container_status}
-                            )
-        except (subprocess.SubprocessError, OSError) as e:
-            logger.warning(f"Docker check failed: {e}")
-        status["docker"] = docker_status
+        if isinstance(docker_result, BaseException):
+            logger.warning(f"Docker check failed: {docker_result}")
+            docker_result = []
+        status["docker"] = docker_result
 
         # Current default route
+        if isinstance(current_wan, BaseException):
+            logger.warning(f"Route check failed: {current_wan}")
+            current_wan = "unknown"
+        status["current_wan"] = current_wan
+
+        return status
+
+    @staticmethod
+    async def _get_docker_status() -> list[dict[str, Any]]:
+        """
+        Get running Docker containers.
+
+        Queries the Engine API over its UNIX socket, which skips the docker
+        CLI startup. Falls back to `docker ps` if the socket is unusable.
+
+        Returns:
+            List of dicts with 'name' and 'running' keys
+        """
         try:
-            route_output = subprocess.run(
-                ["ip", "route", "show", "default"],
-                capture_output=True,
-                text=True,
-                timeout=HARDWARE_QUERY_TIMEOUT,
-                check=False,
+            return await asyncio.wait_for(
+                SystemMonitor._query_docker_socket(), DOCKER_TIMEOUT
             )
-            # Extract interface from route output
-            for iface in MONITORED_INTERFACES:
-                if f"dev {iface}" in route_output.stdout:
-                    status["current_wan"] = iface
-                    break
-            else:
-                status["current_wan"] = "unknown"
-        except (subprocess.SubprocessError, OSError) as e:
-            logger.warning(f"Route check failed: {e}")
-            status["current_wan"] = "unknown"
+        except (OSError, ValueError, asyncio.TimeoutError) as e:
+            logger.debug(f"Docker socket query failed, using CLI: {e}")
 
-        return status
+        returncode, stdout = await SystemMonitor._run_command(
+            ["docker", "ps", "--format", "{{.Names}}:{{.Status}}"], DOCKER_TIMEOUT
+        )
+        docker_status: list[dict[str, Any]] = []
+        if returncode == 0:
+            for line in stdout.strip().split("\n"):
+                if line:
+                    parts = line.split(":", 1)
+                    if len(parts) == 2:
+                        name, container_status = parts
+                        docker_status.append(
+                            {"name": name, "running": "Up" in container_status}
+                        )
+        return docker_status
 
     @staticmethod
-    def _get_temperature() -> float:
+    async def _query_docker_socket() -> list[dict[str, Any]]:
+        """
+        List running containers via GET /containers/json on DOCKER_SOCKET.
+
+        Returns:
+            List of dicts with 'name' and 'running' keys
+
+        Raises:
+            OSError: If the socket cannot be reached
+            ValueError: If the response is not a successful JSON reply
+        """
+        reader, writer = await asyncio.open_unix_connection(DOCKER_SOCKET)
+        try:
+            # HTTP/1.0 makes the daemon close the connection after the body
+            writer.write(b"GET /containers/json HTTP/1.0\r\nHost: docker\r\n\r\n")
+            await writer.drain()
+            response = await reader.read()
+        finally:
+            writer.close()
+
+        head, _, body = response.partition(b"\r\n\r\n")
+        if b" 200 " not in head.split(b"\r\n", 1)[0]:
+            raise ValueError(f"Docker API error: {head[:80]!r}")
+        return [
+            {
+                "name": (container.get("Names") or ["?"])[0].lstrip("/"),
+                "running": container.get("State") == "running",
+            }
+            for container in json.loads(body)
+        ]
+
+    @staticmethod
+    async def _get_current_wan() -> str:
+        """
+        Get the interface carrying the IPv4 default route.
+
+        Asks the kernel over netlink when pyroute2 is available, otherwise
+        reads the routing table from /proc/net/route.
+
+        Returns:
+            Interface name, or "unknown" if no default route was found
+        """
+        if HAS_PYROUTE2:
+            try:
+                async with AsyncIPRoute() as ipr:
+                    routes = await ipr.get_default_routes(family=socket.AF_INET)
+                    async for route in routes:
+                        return socket.if_indextoname(int(route.get_attr("RTA_OIF")))
+                return "unknown"
+            except (NetlinkError, OSError) as e:
+                logger.debug(f"Netlink route lookup failed, using /proc: {e}")
+
+        # Columns: Iface Destination Gateway ...; default route has dest 0
+        try:
+            with open("/proc/net/route") as f:
+                next(f)
+                for line in f:
+                    parts = line.split()
+                    if len(parts) > 1 and parts[1] == "00000000":
+                        return parts[0]
+        except (OSError, StopIteration) as e:
+            logger.warning(f"Route check failed: {e}")
+        return "unknown"
+
+    async def _get_temperature(self, ttl: float = 2.0) -> float:
         """
         Get CPU temperature (platform-specific).
 
@@ -323,42 +586,85 @@ class SystemMonitor:
         2. /sys/class/thermal (Linux generic)
         3. psutil sensors
 
+        The first method that works is remembered and used on later calls,
+        and readings are reused for `ttl` seconds.
+
+        Args:
+            ttl: Seconds a reading stays valid
+
         Returns:
             Temperature in Celsius, or 0.0 if unavailable
         """
-        # Try vcgencmd (Raspberry Pi)
+        now = time.monotonic()
+        cache = self._temp_cache
+        if cache and now - cache[0] < ttl:
+            return cache[1]
+
+        methods: tuple[Callable[[], Awaitable[float | None]], ...]
+        if self._temp_method:
+            methods = (self._temp_method,)
+        else:
+            methods = (
+                SystemMonitor._temp_vcgencmd,
+                SystemMonitor._temp_thermal_zone,
+                SystemMonitor._temp_psutil,
+            )
+
+        temperature = 0.0
+        for method in methods:
+            reading = await method()
+            if reading is not None:
+                self._temp_method = method
+                temperature = reading
+                break
+        else:
+            # Pinned method stopped working, probe again next time
+            self._temp_method = None
+
+        self._temp_cache = (now, temperature)
+        return temperature
+
+    @staticmethod
+    async def _temp_vcgencmd() -> float | None:
+        """Read temperature via vcgencmd (Raspberry Pi)."""
         try:
-            temp_output = subprocess.run(
-                ["vcgencmd", "measure_temp"],
-                capture_output=True,
-                text=True,
-                timeout=HARDWARE_QUERY_TIMEOUT,
-                check=False,
+            returncode, stdout = await SystemMonitor._run_command(
+                ["vcgencmd", "measure_temp"], HARDWARE_QUERY_TIMEOUT
             )
-            if temp_output.returncode == 0 and "=" in temp_output.stdout:
-                temp_str = temp_output.stdout.strip()
+            if returncode == 0 and "=" in stdout:
+                temp_str = stdout.strip()
                 return float(temp_str.split("=")[1].replace("'C", ""))
         except (subprocess.SubprocessError, OSError, ValueError, IndexError):
             pass
+        return None
 
-        # Try /sys/class/thermal (Linux generic)
+    @staticmethod
+    async def _temp_thermal_zone() -> float | None:
+        """Read temperature from /sys/class/thermal (Linux generic)."""
+        # Raw fd read: the value is a few bytes, no buffered text file needed
         try:
-            with open("/sys/class/thermal/thermal_zone0/temp") as f:
-                return float(f.read().strip()) / 1000
+            fd = os.open(THERMAL_ZONE_PATH, os.O_RDONLY)
+            try:
+                raw = os.read(fd, 16)
+            finally:
+                os.close(fd)
+            return int(raw) / 1000
         except (OSError, ValueError):
-            pass
+            return None
 
-        # Try psutil sensors
+    @staticmethod
+    async def _temp_psutil() -> float | None:
+        """Read temperature from psutil sensors."""
         try:
-            temps = psutil.sensors_temperatures()
+            # Walks every hwmon sensor in sysfs, keep it off the event loop
+            temps = await asyncio.to_thread(psutil.sensors_temperatures)
             if temps:
                 for name, entries in temps.items():
                     if entries:
-                        return entries[0].current
+                        return float(entries[0].current)
         except (AttributeError, OSError):
             pass
-
-        return 0.0
+        return None
 
     @staticmethod
     def check_interface_connectivity(interface: str) -> bool:
@@ -379,6 +685,14 @@ class SystemMonitor:
 class AlertManager:
     """Manages alerts and rate limiting."""
 
+    _EMOJIS = {
+        "INFO": "ℹ️",
+        "WARNING": "⚠️",
+        "CRITICAL": "🚨",
+        "SUCCESS": "✅",
+        "RECOVERY": "🔄",
+    }
+
     def __init__(self, bot_config: BotConfig) -> None:
         self.config = bot_config
         self.alert_queue: deque = deque(maxlen=100)
@@ -395,27 +709,34 @@ class AlertManager:
         return True
 
     def format_alert(
-        self, level: str, message: str, details: dict[str, Any] | None = None
+        self,
+        level: str,
+        message: str,
+        details: dict[str, Any] | None = None,
+        timestamp: str | None = None,
     ) -> str:
-        """Format alert message with emoji and details."""
-        emojis = {
-            "INFO": "ℹ️",
-            "WARNING": "⚠️",
-            "CRITICAL": "🚨",
-            "SUCCESS": "✅",
-            "RECOVERY": "🔄",
-        }
-
-        emoji = emojis.get(level, "📢")
-        formatted = f"{self.config.system_prefix} {emoji} *{level}*\n\n{message}"
+        """
+        Format alert message with emoji and details.
+
+        Args:
+            level: Alert level (INFO, WARNING, CRITICAL, SUCCESS, RECOVERY)
+            message: Alert text
+            details: Optional key/value pairs listed under the message
+            timestamp: HH:MM:SS to show, e.g. status["timestamp"][11:19];
+                defaults to the current UTC time
+        """
+        emoji = self._EMOJIS.get(level, "📢")
+        parts = [f"{self.config.system_prefix} {emoji} *{level}*\n\n{message}"]
 
         if details:
-            formatted += "\n\n*Details:*\n"
+            parts.append("\n\n*Details:*\n")
             for key, value in details.items():
-                formatted += f"• {key}: `{value}`\n"
+                parts.append(f"• {key}: `{value}`\n")
 
-        formatted += f"\n_Time: {datetime.now(timezone.utc).strftime('%H:%M:%S')}_"
-        return formatted
+        if timestamp is None:
+            timestamp = datetime.now(timezone.utc).strftime("%H:%M:%S")
+        parts.append(f"\n_Time: {timestamp}_")
+        return "".join(parts)
 
 
 class InteractiveBot:
@@ -427,6 +748,7 @@ class InteractiveBot:
         self.alerts = AlertManager(self.config)
         self.application: Application | None = None
         self.admin_sessions: dict[str, Any] = {}
+        self._cpu_task: asyncio.Task[None] | None = None
 
     async def start_command(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
@@ -450,99 +772,104 @@ class InteractiveBot:
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ) -> None:
         """Handle /status command."""
-        status = self.monitor.get_system_status()
+        status = await self.monitor.get_system_status()
 
         if not status.get("healthy", True):
             await update.message.reply_text(
                 "⚠️ System status degraded - partial data available"
             )
 
-        msg = f"*{self.config.system_prefix} System Status*\n\n"
-        msg += f"🖥️ *CPU:* {status.get('cpu_percent', 0):.1f}%\n"
-        msg += f"💾 *Memory:* {status.get('memory_percent', 0):.1f}% "
-        msg += f"({status.get('memory_used_gb', 0):.1f}/{status.get('memory_total_gb', 0):.1f} GB)\n"
-        msg += f"💿 *Disk:* {status.get('disk_percent', 0):.1f}% "
-        msg += f"({status.get('disk_used_gb', 0):.1f}/{status.get('disk_total_gb', 0):.1f} GB)\n"
-        msg += f"🌡️ *Temperature:* {status.get('temperature', 0):.1f}°C\n"
-        msg += f"🌐 *Active Interface:* {status.get('current_wan', 'unknown')}\n\n"
+        parts = [
+            f"*{self.config.system_prefix} System Status*\n\n",
+            f"🖥️ *CPU:* {status.get('cpu_percent', 0):.1f}%\n",
+            f"💾 *Memory:* {status.get('memory_percent', 0):.1f}% ",
+            f"({status.get('memory_used_gb', 0):.1f}/{status.get('memory_total_gb', 0):.1f} GB)\n",
+            f"💿 *Disk:* {status.get('disk_percent', 0):.1f}% ",
+            f"({status.get('disk_used_gb', 0):.1f}/{status.get('disk_total_gb', 0):.1f} GB)\n",
+            f"🌡️ *Temperature:* {status.get('temperature', 0):.1f}°C\n",
+            f"🌐 *Active Interface:* {status.get('current_wan', 'unknown')}\n\n",
+        ]
 
         # Services
-        msg += "*Services:*\n"
+        parts.append("*Services:*\n")
         for service, active in status.get("services", {}).items():
             emoji = "✅" if active else "❌"
-            msg += f"  {emoji} {service}\n"
+            parts.append(f"  {emoji} {service}\n")
 
         # Network interfaces
-        msg += "\n*Network Interfaces:*\n"
+        parts.append("\n*Network Interfaces:*\n")
         for iface, ip in status.get("interfaces", {}).items():
-            msg += f"  • {iface}: `{ip}`\n"
+            parts.append(f"  • {iface}: `{ip}`\n")
 
-        msg += f"\n_Updated: {datetime.now(timezone.utc).strftime('%H:%M:%S')}_"
-        await update.message.reply_text(msg, parse_mode=ParseMode.MARKDOWN)
+        parts.append(f"\n_Updated: {status['timestamp'][11:19]}_")
+        await update.message.reply_text("".join(parts), parse_mode=ParseMode.MARKDOWN)
 
     async def services_command(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ) -> None:
         """Handle /services command."""
-        status = self.monitor.get_system_status()
+        status = await self.monitor.get_system_status()
 
-        msg = f"*{self.config.system_prefix} Service Status*\n\n"
+        parts = [f"*{self.config.system_prefix} Service Status*\n\n"]
 
         # System services
-        msg += "*System Services:*\n"
+        parts.append("*System Services:*\n")
         for service, active in status.get("services", {}).items():
             emoji = "✅" if active else "❌"
-            msg += f"  {emoji} {service}\n"
+            parts.append(f"  {emoji} {service}\n")
 
         # Docker containers
         if status.get("docker"):
-            msg += "\n*Docker Containers:*\n"
+            parts.append("\n*Docker Containers:*\n")
             for container in status["docker"]:
                 emoji = "🟢" if container["running"] else "🔴"
-                msg += f"  {emoji} {container['name']}\n"
+                parts.append(f"  {emoji} {container['name']}\n")
 
-        msg += f"\n_Updated: {datetime.now(timezone.utc).strftime('%H:%M:%S')}_"
-        await update.message.reply_text(msg, parse_mode=ParseMode.MARKDOWN)
+        parts.append(f"\n_Updated: {status['timestamp'][11:19]}_")
+        await update.message.reply_text("".join(parts), parse_mode=ParseMode.MARKDOWN)
 
     async def metrics_command(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ) -> None:
         """Handle /metrics command with visual bars."""
-        status = self.monitor.get_system_status()
-
-        def get_bar(percent: float, width: int = 10) -> str:
-            filled = int(percent / 100 * width)
-            return "█" * filled + "░" * (width - filled)
+        status = await self.monitor.get_system_status()
 
-        msg = f"*{self.config.system_prefix} System Metrics*\n\n"
+        parts = [f"*{self.config.system_prefix} System Metrics*\n\n"]
 
         # CPU
-        cpu_bar = get_bar(status.get("cpu_percent", 0))
-        msg += f"🖥️ *CPU:* {cpu_bar} {status.get('cpu_percent', 0):.1f}%\n"
+        cpu = status.get("cpu_percent", 0)
+        filled = min(int(cpu / 10), 10)
+        parts.append(f"🖥️ *CPU:* {BAR[10 - filled:20 - filled]} {cpu:.1f}%\n")
 
         # Memory
-        mem_bar = get_bar(status.get("memory_percent", 0))
-        msg += f"💾 *RAM:* {mem_bar} {status.get('memory_percent', 0):.1f}%\n"
-        msg += f"   Used: {status.get('memory_used_gb', 0):.1f} GB / {status.get('memory_total_gb', 0):.1f} GB\n\n"
+        mem = status.get("memory_percent", 0)
+        filled = min(int(mem / 10), 10)
+        parts.append(f"💾 *RAM:* {BAR[10 - filled:20 - filled]} {mem:.1f}%\n")
+        parts.append(
+            f"   Used: {status.get('memory_used_gb', 0):.1f} GB / {status.get('memory_total_gb', 0):.1f} GB\n\n"
+        )
 
         # Disk
-        disk_bar = get_bar(status.get("disk_percent", 0))
-        msg += f"💿 *Disk:* {disk_bar} {status.get('disk_percent', 0):.1f}%\n"
-        msg += f"   Used: {status.get('disk_used_gb', 0):.1f} GB / {status.get('disk_total_gb', 0):.1f} GB\n\n"
+        disk = status.get("disk_percent", 0)
+        filled = min(int(disk / 10), 10)
+        parts.append(f"💿 *Disk:* {BAR[10 - filled:20 - filled]} {disk:.1f}%\n")
+        parts.append(
+            f"   Used: {status.get('disk_used_gb', 0):.1f} GB / {status.get('disk_total_gb', 0):.1f} GB\n\n"
+        )
 
         # Temperature
         temp = status.get("temperature", 0)
         temp_emoji = "🟢" if temp < 60 else "🟡" if temp < 70 else "🔴"
-        msg += f"🌡️ *Temp:* {temp_emoji} {temp:.1f}°C\n"
+        parts.append(f"🌡️ *Temp:* {temp_emoji} {temp:.1f}°C\n")
 
-        msg += f"\n_Updated: {datetime.now(timezone.utc).strftime('%H:%M:%S')}_"
-        await update.message.reply_text(msg, parse_mode=ParseMode.MARKDOWN)
+        parts.append(f"\n_Updated: {status['timestamp'][11:19]}_")
+        await update.message.reply_text("".join(parts), parse_mode=ParseMode.MARKDOWN)
 
     async def restart_command(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ) -> None:
         """Handle /restart command (admin only)."""
-        user_id = str(update.effective_user.id)
+        user_id = update.effective_user.id
 
         if user_id not in self.config.admin_ids:
             await update.message.reply_text("❌ Unauthorized: Admin access required")
@@ -561,12 +888,12 @@ class InteractiveBot:
         service_name = context.args[0]
 
         # Security: Whitelist validation
-        if service_name not in ALLOWED_SERVICES:
+        if service_name not in ALLOWED_SERVICES_SET:
             await update.message.reply_text(
                 f"❌ *Service not allowed*\n\n"
                 f"Service '{service_name}' is not in the allowed list.\n\n"
                 f"Allowed services:\n"
-                + "\n".join([f"• `{s}`" for s in sorted(ALLOWED_SERVICES)]),
+                + "\n".join([f"• `{s}`" for s in ALLOWED_SERVICES_SORTED]),
                 parse_mode=ParseMode.MARKDOWN,
             )
             return
@@ -575,7 +902,8 @@ class InteractiveBot:
         keyboard = [
             [
                 InlineKeyboardButton(
-                    "✅ Confirm", callback_data=f"restart_confirm_{service_name}"
+                    "✅ Confirm",
+                    callback_data=f"{RESTART_CONFIRM_PREFIX}{service_name}",
                 ),
                 InlineKeyboardButton("❌ Cancel", callback_data="restart_cancel"),
             ]
@@ -598,16 +926,18 @@ class InteractiveBot:
         await query.answer()
 
         data = query.data
+        if not data:
+            return
 
         if data == "restart_cancel":
             await query.edit_message_text("❌ Restart cancelled")
             return
 
-        if data.startswith("restart_confirm_"):
-            service_name = data.replace("restart_confirm_", "")
+        if data.startswith(RESTART_CONFIRM_PREFIX):
+            service_name = data[_RESTART_CONFIRM_PREFIX_LEN:]
 
             # Re-validate (callback data could be manipulated)
-            if service_name not in ALLOWED_SERVICES:
+            if service_name not in ALLOWED_SERVICES_SET:
                 await query.edit_message_text(
                     f"❌ Security Error: Service '{service_name}' not allowed"
                 )
@@ -616,7 +946,9 @@ class InteractiveBot:
             await query.edit_message_text(f"🔄 Restarting {service_name}...")
 
             try:
-                result = subprocess.run(
+                # Blocking restart can take up to SUBPROCESS_TIMEOUT, run in a thread
+                result = await asyncio.to_thread(
+                    subprocess.run,
                     ["sudo", "systemctl", "restart", service_name],
                     capture_output=True,
                     text=True,
@@ -625,7 +957,8 @@ class InteractiveBot:
                 )
 
                 if result.returncode == 0:
-                    check = subprocess.run(
+                    check = await asyncio.to_thread(
+                        subprocess.run,
                         ["systemctl", "is-active", service_name],
                         capture_output=True,
                         text=True,
@@ -675,10 +1008,11 @@ class InteractiveBot:
                     except ValueError:
                         pass
 
-        lines = min(lines, 50)
+        # Only the last 10 entries fit in the reply, so never ask for more
+        lines = max(1, min(lines, 10))
 
         # Security: Validate service name to prevent command injection
-        if service and not SERVICE_NAME_PATTERN.match(service):
+        if service and not is_valid_service_name(service):
             await update.message.reply_text(
                 "❌ Invalid service name. Use only letters, numbers, "
                 "underscores, hyphens, dots, and @."
@@ -709,23 +1043,16 @@ class InteractiveBot:
                     "short",
                 ]
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=DOCKER_TIMEOUT,
-                check=False,
-            )
+            log_lines = await self.monitor.tail_command(cmd, lines, DOCKER_TIMEOUT)
 
-            if result.stdout.strip():
-                log_lines = result.stdout.strip().split("\n")[-lines:]
+            if log_lines:
                 msg = f"*📋 System Logs*"
                 if service:
                     msg += f" *[{service}]*\n"
                 else:
                     msg += " *(Warnings & Errors)*\n"
                 msg += f"_Last {len(log_lines)} entries:_\n\n"
-                msg += "```\n" + "\n".join(log_lines[-10:]) + "\n```"
+                msg += "```\n" + "\n".join(log_lines) + "\n```"
                 await update.message.reply_text(
                     msg[:4000], parse_mode=ParseMode.MARKDOWN
                 )
@@ -740,26 +1067,28 @@ class InteractiveBot:
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ) -> None:
         """Handle /help command."""
-        user_id = str(update.effective_user.id)
+        user_id = update.effective_user.id
         is_admin = user_id in self.config.admin_ids
 
-        msg = f"*{self.config.system_name} Bot Commands*\n\n"
-        msg += "*📊 Monitoring:*\n"
-        msg += "`/status` (`/s`) - System overview\n"
-        msg += "`/services` (`/v`) - Service status\n"
-        msg += "`/docker` (`/d`) - Docker containers\n"
-        msg += "`/metrics` (`/m`) - Performance metrics\n"
-        msg += "`/logs` (`/l`) [lines] [service] - View logs\n\n"
+        parts = [
+            f"*{self.config.system_name} Bot Commands*\n\n",
+            "*📊 Monitoring:*\n",
+            "`/status` (`/s`) - System overview\n",
+            "`/services` (`/v`) - Service status\n",
+            "`/docker` (`/d`) - Docker containers\n",
+            "`/metrics` (`/m`) - Performance metrics\n",
+            "`/logs` (`/l`) [lines] [service] - View logs\n\n",
+        ]
 
         if is_admin:
-            msg += "*🔧 Admin Commands:*\n"
-            msg += "`/restart` (`/r`) <service> - Restart a service\n\n"
+            parts.append("*🔧 Admin Commands:*\n")
+            parts.append("`/restart` (`/r`) <service> - Restart a service\n\n")
 
-        msg += "*ℹ️ Info:*\n"
-        msg += "`/help` (`/h`) - Show this message\n\n"
-        msg += "_💡 Tip: Use short aliases for faster access!_\n"
+        parts.append("*ℹ️ Info:*\n")
+        parts.append("`/help` (`/h`) - Show this message\n\n")
+        parts.append("_💡 Tip: Use short aliases for faster access!_\n")
 
-        await update.message.reply_text(msg, parse_mode=ParseMode.MARKDOWN)
+        await update.message.reply_text("".join(parts), parse_mode=ParseMode.MARKDOWN)
 
     async def send_alert(
         self, level: str, message: str, details: dict[str, Any] | None = None
@@ -782,7 +1111,11 @@ class InteractiveBot:
         formatted_message = self.alerts.format_alert(level, message, details)
 
         try:
-            bot = Bot(token=self.config.token)
+            # Reuse the application's bot and its pooled HTTP connection
+            if self.application:
+                bot = self.application.bot
+            else:
+                bot = Bot(token=self.config.token)
             await bot.send_message(
                 chat_id=self.config.chat_id,
                 text=formatted_message,
@@ -799,22 +1132,18 @@ class InteractiveBot:
         if not self.application:
             return
 
-        # Command handlers with aliases
-        self.application.add_handler(CommandHandler("start", self.start_command))
-        self.application.add_handler(CommandHandler("status", self.status_command))
-        self.application.add_handler(CommandHandler("s", self.status_command))
-        self.application.add_handler(CommandHandler("services", self.services_command))
-        self.application.add_handler(CommandHandler("v", self.services_command))
-        self.application.add_handler(CommandHandler("docker", self.services_command))
-        self.application.add_handler(CommandHandler("d", self.services_command))
-        self.application.add_handler(CommandHandler("metrics", self.metrics_command))
-        self.application.add_handler(CommandHandler("m", self.metrics_command))
-        self.application.add_handler(CommandHandler("logs", self.logs_command))
-        self.application.add_handler(CommandHandler("l", self.logs_command))
-        self.application.add_handler(CommandHandler("restart", self.restart_command))
-        self.application.add_handler(CommandHandler("r", self.restart_command))
-        self.application.add_handler(CommandHandler("help", self.help_command))
-        self.application.add_handler(CommandHandler("h", self.help_command))
+        # Command handlers with aliases (one handler per command)
+        commands = (
+            (["start"], self.start_command),
+            (["status", "s"], self.status_command),
+            (["services", "v", "docker", "d"], self.services_command),
+            (["metrics", "m"], self.metrics_command),
+            (["logs", "l"], self.logs_command),
+            (["restart", "r"], self.restart_command),
+            (["help", "h"], self.help_command),
+        )
+        for names, callback in commands:
+            self.application.add_handler(CommandHandler(names, callback))
 
         # Callback handler for inline keyboards
         self.application.add_handler(CallbackQueryHandler(self.handle_restart_callback))
@@ -831,6 +1160,12 @@ class InteractiveBot:
             self.application = Application.builder().token(self.config.token).build()
             self.setup_handlers()
 
+        if not self._cpu_task:
+            self._cpu_task = asyncio.create_task(self.monitor.sample_cpu())
+
+        # Initialize first so the startup alert goes through application.bot
+        await self.application.initialize()
+
         # Send startup message
         await self.send_alert(
             "INFO",
@@ -842,7 +1177,6 @@ class InteractiveBot:
         )
 
         # Start polling
-        await self.application.initialize()
         await self.application.start()
         await self.application.updater.start_polling(drop_pending_updates=True)
 
@@ -852,6 +1186,10 @@ class InteractiveBot:
         """Gracefully stop the bot."""
         logger.info("Stopping bot...")
 
+        if self._cpu_task:
+            self._cpu_task.cancel()
+            self._cpu_task = None
+
         if self.application:
             await self.send_alert(
                 "INFO", "Bot Stopping", {"Reason": "Service shutdown"}
@@ -23,8 +23,17 @@ Usage:
     collector = RemoteMetricsCollector(host="your-host", user="your-user")
     metrics = collector.collect_all_metrics()
 
+    # Poll several hosts concurrently
+    poller = MultiHostPoller.from_targets()
+    results = asyncio.run(poller.poll_all())
+
+    # Collect in the background, read the latest snapshot at any time
+    background = BackgroundCollector(MetricsCollector())
+    background.start()
+    metrics = background.snapshot()
+
     # CLI usage
-    python3 metrics_collector.py [--remote HOST]
+    python3 metrics_collector.py [--remote HOST ...] [--targets]
 
 Configuration:
     SSH targets can be configured in config/ssh_targets.yml
@@ -32,15 +41,20 @@ Configuration:
 Version: 1.0.0
 """
 
+import asyncio
+import functools
 import json
-import re
+import os
+import random
 import shlex
+import shutil
 import subprocess
 import sys
+import threading
 import time
-from datetime import datetime
+from collections.abc import Callable, Collection
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar, cast
 
 # Try to import psutil (optional for local metrics)
 try:
@@ -51,11 +65,11 @@ except ImportError:
     HAS_PSUTIL = False
 
 # Import local config loader
-try:
-    from config_loader import load_config, load_ssh_targets, load_service_monitoring
-except ImportError:
-    sys.path.insert(0, str(Path(__file__).parent))
-    from config_loader import load_config, load_ssh_targets, load_service_monitoring
+_SRC_DIR = str(Path(__file__).parent)
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
+
+from config_loader import load_config, load_ssh_targets, load_service_monitoring
 
 # Configuration
 CONFIG = load_config()
@@ -66,29 +80,188 @@ SSH_CONFIG = CONFIG.get("ssh", {})
 SSH_CONNECT_TIMEOUT = SSH_CONFIG.get("connect_timeout", 10)
 SSH_COMMAND_TIMEOUT = SSH_CONFIG.get("command_timeout", 15)
 MAX_RETRIES = SSH_CONFIG.get("max_retries", 3)
+# Connection multiplexing: later commands reuse the master connection
+# instead of a new TCP + key exchange; %C is a hash of host, port and user
+SSH_CONTROL_PERSIST = SSH_CONFIG.get("control_persist", "60s")
+SSH_CONTROL_PATH = SSH_CONFIG.get("control_path", "/tmp/ssh-telegram-monitor-%C")
 RETRY_BASE_DELAY = 2
+# Upper bound for a single backoff, plus random jitter so hosts polled
+# together do not retry in lockstep
+RETRY_MAX_DELAY: float = SSH_CONFIG.get("max_retry_delay", 10)
+RETRY_JITTER = 0.5
+# ssh exits with 255 for its own (connection) errors; anything else is the
+# remote command's exit status and not worth retrying
+SSH_ERROR_RETURNCODE = 255
+
+# Kernel interfaces read directly on the local hot path
+THERMAL_ZONE_PATH = "/sys/class/thermal/thermal_zone0/temp"
+MEMINFO_PATH = "/proc/meminfo"
+MEMINFO_FIELDS = frozenset(
+    (b"MemTotal", b"MemFree", b"MemAvailable", b"Buffers", b"Cached", b"SReclaimable")
+)
+
+# Prefix of the lines separating command outputs in a batched SSH call
+BATCH_MARKER = "__METRICS_BATCH__:"
+
+# Seconds each metric is reused before it is collected again
+CACHE_TTL: dict[str, float] = CONFIG.get("metrics", {}).get("cache_ttl", {})
+
+# Metrics of a collection, in output order, and the getter producing each
+METRIC_NAMES = ("cpu_temp", "memory", "disk", "load", "services")
+_GETTERS = {
+    "cpu_temp": "get_cpu_temperature",
+    "memory": "get_memory_stats",
+    "disk": "get_disk_stats",
+    "load": "get_load_average",
+    "services": "get_service_status",
+}
+
+# Seconds between collections of each metric in a BackgroundCollector
+COLLECT_INTERVALS: dict[str, float] = CONFIG.get("metrics", {}).get("intervals", {})
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def _retry_delay(attempt: int) -> float:
+    """Exponential backoff for an SSH retry, capped and with jitter."""
+    delay: float = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY**attempt)
+    return delay + random.uniform(0, RETRY_JITTER)
+
+
+def _configured_services() -> list[str]:
+    """Get critical and important services from service config."""
+    return [
+        *SERVICE_CONFIG.get("critical_services", []),
+        *SERVICE_CONFIG.get("important_services", []),
+    ]
+
+
+def _cached(metric: str) -> Callable[[_F], _F]:
+    """
+    Cache a collector getter's result for the metric's CACHE_TTL.
+
+    Only calls without arguments (the configured defaults) are cached, and
+    empty results are not, so failed probes are retried on the next call.
+    """
+
+    def decorator(func: _F) -> _F:
+        @functools.wraps(func)
+        def wrapper(self: "_CachingCollector", *args: Any, **kwargs: Any) -> Any:
+            if args or kwargs:
+                return func(self, *args, **kwargs)
+            value = self._cache_get(metric)
+            if value is None:
+                value = func(self)
+                self._cache_put(metric, value)
+            return value
+
+        return cast(_F, wrapper)
+
+    return decorator
+
+
+class _CachingCollector:
+    """Per-instance TTL cache shared by the local and remote collectors."""
+
+    def __init__(self) -> None:
+        self._cache: dict[str, tuple[Any, float]] = {}
+
+    def _cache_get(self, metric: str) -> Any:
+        """Return the cached value for metric, or None if missing or expired."""
+        entry = self._cache.get(metric)
+        if entry and time.monotonic() < entry[1]:
+            return entry[0]
+        return None
+
+    def _cache_put(self, metric: str, value: Any) -> None:
+        """Store a non-empty value for metric until its TTL expires."""
+        ttl = CACHE_TTL.get(metric, 0)
+        if value and ttl > 0:
+            self._cache[metric] = (value, time.monotonic() + ttl)
 
+    def invalidate(self, metrics: Collection[str]) -> None:
+        """Drop cached values so the next collection probes these metrics."""
+        for metric in metrics:
+            self._cache.pop(metric, None)
 
-class MetricsCollector:
+
+class MetricsCollector(_CachingCollector):
     """Local system metrics collector using psutil."""
 
     def __init__(self) -> None:
         if not HAS_PSUTIL:
             raise ImportError("psutil is required for local metrics collection")
+        super().__init__()
 
-    def get_cpu_temperature(self) -> float | None:
+        # Kept open so each reading is a single pread() without open/close
+        self._thermal_fd: int | None
+        try:
+            self._thermal_fd = os.open(THERMAL_ZONE_PATH, os.O_RDONLY)
+        except OSError:
+            self._thermal_fd = None
+
+        self._temp_method = self._probe_temperature_method()
+
+    def close(self) -> None:
+        """Release the thermal zone file descriptor."""
+        if self._thermal_fd is not None:
+            os.close(self._thermal_fd)
+            self._thermal_fd = None
+
+    def __del__(self) -> None:
+        # __init__ may have raised before the fd attribute was set
+        if getattr(self, "_thermal_fd", None) is not None:
+            self.close()
+
+    def _probe_temperature_method(self) -> str | None:
         """
-        Get CPU temperature using multiple methods.
+        Pick the temperature source once, so polling never tries the others.
 
         Tries (in order):
-        1. vcgencmd (Raspberry Pi)
-        2. /sys/class/thermal (Linux generic)
+        1. /sys/class/thermal (Linux generic, includes Raspberry Pi)
+        2. vcgencmd (Raspberry Pi, only if installed)
         3. psutil sensors
 
+        Returns:
+            Name of the first reader method that produces a value, or None.
+            Stored by name: a bound method would keep a reference cycle to
+            the collector and delay closing the thermal fd.
+        """
+        methods = ["_temp_sysfs"]
+        if shutil.which("vcgencmd"):
+            methods.append("_temp_vcgencmd")
+        methods.append("_temp_psutil")
+
+        for method in methods:
+            if getattr(self, method)() is not None:
+                return method
+        return None
+
+    @_cached("cpu_temp")
+    def get_cpu_temperature(self) -> float | None:
+        """
+        Get CPU temperature from the source chosen at init.
+
         Returns:
             Temperature in Celsius, or None if unavailable
         """
-        # Try vcgencmd (Raspberry Pi)
+        if self._temp_method is None:
+            return None
+        reading: float | None = getattr(self, self._temp_method)()
+        return reading
+
+    def _temp_sysfs(self) -> float | None:
+        """Read temperature from /sys/class/thermal (Linux generic)."""
+        if self._thermal_fd is None:
+            return None
+        try:
+            return int(os.pread(self._thermal_fd, 32, 0)) / 1000
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _temp_vcgencmd() -> float | None:
+        """Read temperature via vcgencmd (Raspberry Pi)."""
         try:
             result = subprocess.run(
                 ["vcgencmd", "measure_temp"],
@@ -102,28 +275,64 @@ class MetricsCollector:
                 return float(temp_str.split("=")[1].replace("'C", ""))
         except (subprocess.SubprocessError, OSError, ValueError, IndexError):
             pass
+        return None
 
-        # Try /sys/class/thermal (Linux generic)
-        try:
-            with open("/sys/class/thermal/thermal_zone0/temp") as f:
-                return float(f.read().strip()) / 1000
-        except (OSError, ValueError):
-            pass
-
-        # Try psutil sensors
+    @staticmethod
+    def _temp_psutil() -> float | None:
+        """Read temperature from psutil sensors."""
         try:
             temps = psutil.sensors_temperatures()
             if temps:
                 for name, entries in temps.items():
                     if entries:
-                        return entries[0].current
+                        return float(entries[0].current)
         except (AttributeError, OSError):
             pass
-
         return None
 
+    @staticmethod
+    def _read_meminfo() -> dict[bytes, int] | None:
+        """
+        Read the fields of MEMINFO_FIELDS from /proc/meminfo.
+
+        Returns:
+            Dict mapping field name to value in kB, or None if unavailable
+        """
+        try:
+            with open(MEMINFO_PATH, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+
+        fields: dict[bytes, int] = {}
+        for line in data.splitlines():
+            name, _, rest = line.partition(b":")
+            if name in MEMINFO_FIELDS:
+                fields[name] = int(rest.split()[0])
+        return fields if len(fields) == len(MEMINFO_FIELDS) else None
+
+    @_cached("memory")
     def get_memory_stats(self) -> dict[str, Any] | None:
         """Get memory usage statistics."""
+        # Parse just the needed fields instead of building psutil's full
+        # virtual_memory() record; "used" is computed the way psutil does
+        meminfo = self._read_meminfo()
+        if meminfo is not None:
+            total = meminfo[b"MemTotal"]
+            available = meminfo[b"MemAvailable"]
+            used = total - meminfo[b"MemFree"] - meminfo[b"Buffers"]
+            used -= meminfo[b"Cached"] + meminfo[b"SReclaimable"]
+            if used < 0:
+                used = total - meminfo[b"MemFree"]
+            return {
+                "total_mb": total // 1024,
+                "used_mb": used // 1024,
+                "free_mb": available // 1024,
+                "percentage": (
+                    round((total - available) / total * 100, 1) if total else 0.0
+                ),
+            }
+
         try:
             mem = psutil.virtual_memory()
             return {
@@ -135,6 +344,7 @@ class MetricsCollector:
         except OSError:
             return None
 
+    @_cached("disk")
     def get_disk_stats(self, path: str = "/") -> dict[str, Any] | None:
         """Get disk usage for specified path."""
         try:
@@ -149,6 +359,7 @@ class MetricsCollector:
         except OSError:
             return None
 
+    @_cached("load")
     def get_load_average(self) -> dict[str, float] | None:
         """Get system load average."""
         try:
@@ -161,6 +372,7 @@ class MetricsCollector:
         except (OSError, AttributeError):
             return None
 
+    @_cached("services")
     def get_service_status(self, services: list[str] | None = None) -> dict[str, str]:
         """
         Get status of systemd services.
@@ -172,54 +384,86 @@ class MetricsCollector:
             Dict mapping service name to status (active/inactive/failed)
         """
         if services is None:
-            services = SERVICE_CONFIG.get("critical_services", []) + SERVICE_CONFIG.get(
-                "important_services", []
-            )
+            services = _configured_services()
 
         if not services:
             return {}
 
-        result: dict[str, str] = {}
-        for service in services:
-            try:
-                proc = subprocess.run(
-                    ["systemctl", "is-active", service],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                    check=False,
-                )
-                result[service] = proc.stdout.strip() or "unknown"
-            except (subprocess.SubprocessError, OSError):
-                result[service] = "error"
-
-        return result
+        # One call for all units; it prints one state per line and exits
+        # non-zero if any unit is inactive, so only stdout is used
+        try:
+            proc = subprocess.run(
+                ["systemctl", "is-active", *services],
+                capture_output=True,
+                text=True,
+                timeout=5,
+                check=False,
+            )
+        except (subprocess.SubprocessError, OSError):
+            return {service: "error" for service in services}
 
-    def collect_all_metrics(self) -> dict[str, Any]:
-        """Collect all available metrics."""
+        statuses = proc.stdout.splitlines()
         return {
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "cpu_temp": self.get_cpu_temperature(),
-            "memory": self.get_memory_stats(),
-            "disk": self.get_disk_stats(),
-            "load": self.get_load_average(),
-            "services": self.get_service_status(),
+            service: (statuses[i].strip() if i < len(statuses) else "") or "unknown"
+            for i, service in enumerate(services)
         }
 
+    def collect_all_metrics(
+        self, metrics: Collection[str] = METRIC_NAMES
+    ) -> dict[str, Any]:
+        """
+        Collect all available metrics.
+
+        Args:
+            metrics: Names of the metrics to collect (default: all)
 
-class RemoteMetricsCollector:
+        Returns:
+            Dict with a timestamp and one entry per collected metric
+        """
+        result: dict[str, Any] = {"timestamp": time.time()}
+        for metric in METRIC_NAMES:
+            if metric in metrics:
+                result[metric] = getattr(self, _GETTERS[metric])()
+        return result
+
+
+class RemoteMetricsCollector(_CachingCollector):
     """Remote metrics collector via SSH."""
 
+    TEMP_COMMAND = "vcgencmd measure_temp 2>/dev/null || cat /sys/class/thermal/thermal_zone0/temp 2>/dev/null"
+    MEMORY_COMMAND = "free -m | head -2 | tail -1"
+    DISK_COMMAND = "df -h / | tail -1"
+    LOAD_COMMAND = "uptime"
+
     def __init__(
         self,
         host: str,
         user: str = "admin",
         key_path: str | None = None,
     ) -> None:
+        super().__init__()
         self.host = host
         self.user = user
         self.key_path = key_path or SSH_CONFIG.get("key_path", "~/.ssh/id_ed25519")
 
+        # Everything but the remote command is fixed per collector
+        self._ssh_prefix = [
+            "ssh",
+            "-i",
+            str(Path(self.key_path).expanduser()),
+            "-o",
+            "StrictHostKeyChecking=accept-new",
+            "-o",
+            f"ConnectTimeout={SSH_CONNECT_TIMEOUT}",
+            "-o",
+            "ControlMaster=auto",
+            "-o",
+            f"ControlPersist={SSH_CONTROL_PERSIST}",
+            "-o",
+            f"ControlPath={SSH_CONTROL_PATH}",
+            f"{self.user}@{self.host}",
+        ]
+
     def ssh_command(
         self, command: str, timeout: int = SSH_COMMAND_TIMEOUT
     ) -> str | None:
@@ -233,17 +477,7 @@ class RemoteMetricsCollector:
         Returns:
             Command stdout, or None on failure
         """
-        ssh_args = [
-            "ssh",
-            "-i",
-            str(Path(self.key_path).expanduser()),
-            "-o",
-            "StrictHostKeyChecking=accept-new",
-            "-o",
-            f"ConnectTimeout={SSH_CONNECT_TIMEOUT}",
-            f"{self.user}@{self.host}",
-            command,
-        ]
+        ssh_args = [*self._ssh_prefix, command]
 
         for attempt in range(MAX_RETRIES):
             try:
@@ -257,36 +491,70 @@ class RemoteMetricsCollector:
 
                 if result.returncode == 0:
                     return result.stdout.strip()
-                else:
-                    print(
-                        f"SSH command failed (rc={result.returncode}): {result.stderr.strip()}"
-                    )
+
+                stderr = result.stderr.strip()
+                print(f"SSH command failed (rc={result.returncode}): {stderr}")
+                # Remote command failures and rejected keys won't fix themselves
+                if (
+                    result.returncode != SSH_ERROR_RETURNCODE
+                    or "Permission denied" in stderr
+                ):
                     return None
 
             except subprocess.TimeoutExpired:
                 print(f"SSH timeout (attempt {attempt + 1}/{MAX_RETRIES})")
-                if attempt < MAX_RETRIES - 1:
-                    delay = RETRY_BASE_DELAY**attempt
-                    print(f"Retrying in {delay}s...")
-                    time.sleep(delay)
-                else:
-                    return None
 
             except OSError as e:
                 print(f"SSH error (attempt {attempt + 1}/{MAX_RETRIES}): {e}")
-                if attempt < MAX_RETRIES - 1:
-                    delay = RETRY_BASE_DELAY**attempt
-                    time.sleep(delay)
-                else:
-                    return None
+
+            if attempt < MAX_RETRIES - 1:
+                delay = _retry_delay(attempt)
+                print(f"Retrying in {delay:.1f}s...")
+                time.sleep(delay)
 
         return None
 
+    def ssh_command_batch(
+        self, commands: dict[str, str], timeout: int = SSH_COMMAND_TIMEOUT
+    ) -> dict[str, str]:
+        """
+        Execute several commands in a single SSH session.
+
+        Each command's output is preceded by a marker line, so the combined
+        stdout can be split back per command. Retries apply to the batch.
+
+        Args:
+            commands: Dict mapping a key to a shell command
+            timeout: Timeout for the whole batch in seconds
+
+        Returns:
+            Dict mapping each key to its stripped output (empty on failure)
+        """
+        script = "; ".join(
+            f"echo {BATCH_MARKER}{key}; {command}" for key, command in commands.items()
+        )
+        # Exit 0 so a failing probe (e.g. an inactive service) keeps the rest
+        output = self.ssh_command(f"{script}; true", timeout)
+        if output is None:
+            return {}
+
+        sections: dict[str, list[str]] = {}
+        current: list[str] | None = None
+        for line in output.splitlines():
+            if line.startswith(BATCH_MARKER):
+                current = sections.setdefault(line[len(BATCH_MARKER) :], [])
+            elif current is not None:
+                current.append(line)
+        return {key: "\n".join(lines).strip() for key, lines in sections.items()}
+
+    @_cached("cpu_temp")
     def get_cpu_temperature(self) -> float | None:
         """Get CPU temperature from remote device."""
-        output = self.ssh_command(
-            "vcgencmd measure_temp 2>/dev/null || cat /sys/class/thermal/thermal_zone0/temp 2>/dev/null"
-        )
+        return self._parse_cpu_temperature(self.ssh_command(self.TEMP_COMMAND))
+
+    @staticmethod
+    def _parse_cpu_temperature(output: str | None) -> float | None:
+        """Parse vcgencmd or millidegree temperature output."""
         if output:
             # Try vcgencmd format first
             if "temp=" in output:
@@ -301,9 +569,14 @@ class RemoteMetricsCollector:
                 pass
         return None
 
+    @_cached("memory")
     def get_memory_stats(self) -> dict[str, Any] | None:
         """Get memory usage from remote device."""
-        output = self.ssh_command("free -m | head -2 | tail -1")
+        return self._parse_memory_stats(self.ssh_command(self.MEMORY_COMMAND))
+
+    @staticmethod
+    def _parse_memory_stats(output: str | None) -> dict[str, Any] | None:
+        """Parse the Mem: line of `free -m`."""
         if output:
             parts = output.split()
             if len(parts) >= 3:
@@ -320,9 +593,14 @@ class RemoteMetricsCollector:
                     pass
         return None
 
+    @_cached("disk")
     def get_disk_stats(self) -> dict[str, Any] | None:
         """Get disk usage from remote device."""
-        output = self.ssh_command("df -h / | tail -1")
+        return self._parse_disk_stats(self.ssh_command(self.DISK_COMMAND))
+
+    @staticmethod
+    def _parse_disk_stats(output: str | None) -> dict[str, Any] | None:
+        """Parse the root filesystem line of `df -h /`."""
         if output:
             parts = output.split()
             if len(parts) >= 5:
@@ -338,51 +616,288 @@ class RemoteMetricsCollector:
                     pass
         return None
 
+    @_cached("load")
     def get_load_average(self) -> dict[str, float] | None:
         """Get load average from remote device."""
-        output = self.ssh_command("uptime")
-        if output and "load average:" in output:
-            match = re.search(r"load average: ([\d.]+), ([\d.]+), ([\d.]+)", output)
-            if match:
+        return self._parse_load_average(self.ssh_command(self.LOAD_COMMAND))
+
+    @staticmethod
+    def _parse_load_average(output: str | None) -> dict[str, float] | None:
+        """Parse the load averages out of `uptime` output."""
+        if output:
+            # "... load average: 0.52, 0.48, 0.45" -> plain string split
+            _, found, rest = output.partition("load average:")
+            values = rest.split(",")[:3]
+            if found and len(values) == 3:
                 try:
                     return {
-                        "load_1min": float(match.group(1)),
-                        "load_5min": float(match.group(2)),
-                        "load_15min": float(match.group(3)),
+                        "load_1min": float(values[0]),
+                        "load_5min": float(values[1]),
+                        "load_15min": float(values[2]),
                     }
                 except ValueError:
                     pass
         return None
 
+    @staticmethod
+    def _service_command(services: list[str]) -> str:
+        """Build a `systemctl is-active` command for the given services."""
+        # Security: Quote service names to prevent command injection
+        service_list = " ".join(shlex.quote(s) for s in services)
+        return f"systemctl is-active {service_list}"
+
+    @_cached("services")
     def get_service_status(self, services: list[str] | None = None) -> dict[str, str]:
         """Get service status from remote device."""
         if services is None:
-            services = SERVICE_CONFIG.get("critical_services", []) + SERVICE_CONFIG.get(
-                "important_services", []
-            )
+            services = _configured_services()
 
         if not services:
             return {}
 
-        # Security: Quote service names to prevent command injection
-        service_list = " ".join(shlex.quote(s) for s in services)
-        output = self.ssh_command(f"systemctl is-active {service_list}")
+        return self._parse_service_status(
+            services, self.ssh_command(self._service_command(services))
+        )
+
+    @staticmethod
+    def _parse_service_status(
+        services: list[str], output: str | None
+    ) -> dict[str, str]:
+        """Pair `systemctl is-active` output lines with service names."""
         if output:
             statuses = output.split("\n")
             return dict(zip(services, statuses, strict=False))
         return {}
 
-    def collect_all_metrics(self) -> dict[str, Any]:
-        """Collect all metrics from remote device."""
-        return {
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "host": self.host,
-            "cpu_temp": self.get_cpu_temperature(),
-            "memory": self.get_memory_stats(),
-            "disk": self.get_disk_stats(),
-            "load": self.get_load_average(),
-            "services": self.get_service_status(),
+    def collect_all_metrics(
+        self, metrics: Collection[str] = METRIC_NAMES
+    ) -> dict[str, Any]:
+        """
+        Collect all metrics from remote device.
+
+        All stale probes run in one SSH session instead of one connection
+        each; metrics still within their cache TTL are not re-queried.
+
+        Args:
+            metrics: Names of the metrics to collect (default: all)
+
+        Returns:
+            Dict with timestamp, host and one entry per collected metric
+        """
+        services = _configured_services()
+        probes: dict[str, tuple[str, Callable[[str | None], Any]]] = {
+            "cpu_temp": (self.TEMP_COMMAND, self._parse_cpu_temperature),
+            "memory": (self.MEMORY_COMMAND, self._parse_memory_stats),
+            "disk": (self.DISK_COMMAND, self._parse_disk_stats),
+            "load": (self.LOAD_COMMAND, self._parse_load_average),
+        }
+        if services:
+            probes["services"] = (
+                self._service_command(services),
+                functools.partial(self._parse_service_status, services),
+            )
+
+        values: dict[str, Any] = {}
+        stale: dict[str, str] = {}
+        for metric, (command, _) in probes.items():
+            if metric not in metrics:
+                continue
+            values[metric] = self._cache_get(metric)
+            if values[metric] is None:
+                stale[metric] = command
+
+        outputs = self.ssh_command_batch(stale) if stale else {}
+        for metric in stale:
+            values[metric] = probes[metric][1](outputs.get(metric))
+            self._cache_put(metric, values[metric])
+
+        result: dict[str, Any] = {"timestamp": time.time(), "host": self.host}
+        for metric in METRIC_NAMES:
+            if metric in metrics:
+                result[metric] = values.get(metric)
+        if "services" in result:
+            result["services"] = result["services"] or {}
+        return result
+
+
+class MultiHostPoller:
+    """Polls several remote collectors concurrently."""
+
+    def __init__(self, collectors: list[RemoteMetricsCollector]) -> None:
+        self.collectors = collectors
+
+    @classmethod
+    def from_targets(
+        cls, targets: list[dict[str, Any]] | None = None
+    ) -> "MultiHostPoller":
+        """
+        Build a poller from SSH target definitions.
+
+        Args:
+            targets: Target dicts with host, user and optional key_path,
+                or None to load them from ssh_targets.yml
+
+        Returns:
+            MultiHostPoller with one collector per target
+        """
+        if targets is None:
+            targets = load_ssh_targets()
+        return cls(
+            [
+                RemoteMetricsCollector(
+                    host=target["host"],
+                    user=target.get("user", "admin"),
+                    key_path=target.get("key_path"),
+                )
+                for target in targets
+                if target.get("host")
+            ]
+        )
+
+    async def poll_all(self) -> list[dict[str, Any] | None]:
+        """
+        Collect metrics from all hosts at once.
+
+        Each collector runs in its own thread, so total latency is that of
+        the slowest host rather than the sum. A failing host yields None
+        instead of failing the whole poll.
+
+        Returns:
+            Metrics per collector, in collector order
+        """
+        results = await asyncio.gather(
+            *(asyncio.to_thread(c.collect_all_metrics) for c in self.collectors),
+            return_exceptions=True,
+        )
+        metrics: list[dict[str, Any] | None] = []
+        for collector, result in zip(self.collectors, results):
+            if isinstance(result, BaseException):
+                print(f"Collection failed for {collector.host}: {result}")
+                metrics.append(None)
+            else:
+                metrics.append(result)
+        return metrics
+
+
+class BackgroundCollector:
+    """
+    Collects metrics on a daemon thread and publishes the latest snapshot.
+
+    Readers get the last complete metrics dict without waiting on SSH or
+    systemctl. Each collection builds a new dict and swaps it in with a
+    single attribute assignment, so readers need no lock.
+
+    Every metric has its own cadence: slow-changing ones such as disk usage
+    and service status are collected less often than CPU temperature or
+    memory, and the metrics due together are collected in one call.
+    """
+
+    def __init__(
+        self,
+        collector: MetricsCollector | RemoteMetricsCollector,
+        intervals: dict[str, float] | None = None,
+    ) -> None:
+        self.collector = collector
+        self.intervals = {
+            metric: (intervals or COLLECT_INTERVALS).get(metric, 10)
+            for metric in METRIC_NAMES
         }
+        self._next_due = dict.fromkeys(METRIC_NAMES, 0.0)
+        self._snapshot: dict[str, Any] = {}
+        self._ready = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start the collection thread (no-op if already running)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._loop, name="metrics-collector", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the collection thread and wait for it to finish."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def wait_ready(self, timeout: float | None = None) -> bool:
+        """
+        Block until the first snapshot is published.
+
+        Args:
+            timeout: Seconds to wait, or None to wait indefinitely
+
+        Returns:
+            True if a snapshot is available
+        """
+        return self._ready.wait(timeout)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the latest metrics (empty until the first collection)."""
+        return self._snapshot
+
+    def _loop(self) -> None:
+        """Collect each metric when it is due until stopped."""
+        while not self._stopped.is_set():
+            now = time.monotonic()
+            due = [m for m in METRIC_NAMES if now >= self._next_due[m]]
+            try:
+                # The schedule decides freshness here: a cached value that is
+                # still valid would just republish the previous reading
+                self.collector.invalidate(due)
+                update = self.collector.collect_all_metrics(due)
+                self._snapshot = {**self._snapshot, **update}
+            except Exception as e:
+                print(f"Background collection failed: {e}")
+            for metric in due:
+                self._next_due[metric] = now + self.intervals[metric]
+            self._ready.set()
+
+            delay = min(self._next_due.values()) - time.monotonic()
+            self._stopped.wait(max(delay, 0))
+
+
+def format_ts(ts: float) -> str:
+    """
+    Format a metrics timestamp for display.
+
+    Args:
+        ts: Epoch seconds, as stored in the "timestamp" field of a metrics dict
+
+    Returns:
+        Local time as "YYYY-MM-DD HH:MM:SS"
+    """
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts))
+
+
+def _print_metrics(metrics: dict[str, Any]) -> None:
+    """Print a metrics dict in human-readable form."""
+    print(f"Timestamp: {format_ts(metrics['timestamp'])}")
+    if metrics.get("host"):
+        print(f"Host: {metrics['host']}")
+    print(f"CPU Temp: {metrics.get('cpu_temp', 'N/A')}°C")
+    if metrics.get("memory"):
+        print(
+            f"Memory: {metrics['memory']['percentage']}% ({metrics['memory']['used_mb']}/{metrics['memory']['total_mb']} MB)"
+        )
+    if metrics.get("disk"):
+        print(
+            f"Disk: {metrics['disk']['percentage']}% ({metrics['disk']['used']}/{metrics['disk']['size']})"
+        )
+    if metrics.get("load"):
+        print(
+            f"Load: {metrics['load']['load_1min']:.2f} / {metrics['load']['load_5min']:.2f} / {metrics['load']['load_15min']:.2f}"
+        )
+    if metrics.get("services"):
+        print("Services:")
+        for svc, status in metrics["services"].items():
+            emoji = "✅" if status == "active" else "❌"
+            print(f"  {emoji} {svc}: {status}")
 
 
 def main() -> int:
@@ -394,7 +909,14 @@ def main() -> int:
         "--remote",
         "-r",
         metavar="HOST",
-        help="Collect from remote host via SSH",
+        action="append",
+        help="Collect from remote host via SSH (repeat for several hosts)",
+    )
+    parser.add_argument(
+        "--targets",
+        "-t",
+        action="store_true",
+        help="Collect from all hosts in ssh_targets.yml",
     )
     parser.add_argument(
         "--user",
@@ -416,41 +938,35 @@ def main() -> int:
 
     args = parser.parse_args()
 
-    if args.remote:
+    if args.targets or (args.remote and len(args.remote) > 1):
+        if args.targets:
+            poller = MultiHostPoller.from_targets()
+        else:
+            poller = MultiHostPoller(
+                [
+                    RemoteMetricsCollector(host=host, user=args.user, key_path=args.key)
+                    for host in args.remote
+                ]
+            )
+        results = [m for m in asyncio.run(poller.poll_all()) if m is not None]
+    elif args.remote:
         collector = RemoteMetricsCollector(
-            host=args.remote,
+            host=args.remote[0],
             user=args.user,
             key_path=args.key,
         )
+        results = [collector.collect_all_metrics()]
     else:
-        collector = MetricsCollector()
-
-    metrics = collector.collect_all_metrics()
+        results = [MetricsCollector().collect_all_metrics()]
 
     if args.json:
-        print(json.dumps(metrics, indent=2))
+        results = [{**m, "timestamp": format_ts(m["timestamp"])} for m in results]
+        print(json.dumps(results[0] if len(results) == 1 else results, indent=2))
     else:
-        print(f"Timestamp: {metrics.get('timestamp')}")
-        if metrics.get("host"):
-            print(f"Host: {metrics['host']}")
-        print(f"CPU Temp: {metrics.get('cpu_temp', 'N/A')}°C")
-        if metrics.get("memory"):
-            print(
-                f"Memory: {metrics['memory']['percentage']}% ({metrics['memory']['used_mb']}/{metrics['memory']['total_mb']} MB)"
-            )
-        if metrics.get("disk"):
-            print(
-                f"Disk: {metrics['disk']['percentage']}% ({metrics['disk']['used']}/{metrics['disk']['size']})"
-            )
-        if metrics.get("load"):
-            print(
-                f"Load: {metrics['load']['load_1min']:.2f} / {metrics['load']['load_5min']:.2f} / {metrics['load']['load_15min']:.2f}"
-            )
-        if metrics.get("services"):
-            print("Services:")
-            for svc, status in metrics["services"].items():
-                emoji = "✅" if status == "active" else "❌"
-                print(f"  {emoji} {svc}: {status}")
+        for index, metrics in enumerate(results):
+            if index:
+                print()
+            _print_metrics(metrics)
 
     return 0
 
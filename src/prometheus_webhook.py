@@ -25,21 +25,40 @@ Usage:
 Environment Variables:
     FLASK_HOST: Bind address (default: 127.0.0.1)
     FLASK_PORT: Port number (default: 9094)
+    TELEGRAM_BOT_TOKEN: Override token from config file
+    TELEGRAM_CHAT_ID: Override chat ID from config file
+    TELEGRAM_CONFIG_DIR: Directory containing telegram_config.yml
 
 Version: 1.0.0
 """
 
+import functools
 import hashlib
 import json
 import logging
 import os
+import string
 import subprocess
 import sys
+import threading
 import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
-from flask import Flask, jsonify, request
+import requests
+from flask import Flask, Response, request
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson is optional (faster C serializer); fall back to stdlib json
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 # Logging Configuration
 logging.basicConfig(
@@ -47,6 +66,8 @@ logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
 logger = logging.getLogger(__name__)
+# urllib3 logs each retry with the request path, which embeds the bot token
+logging.getLogger("urllib3").setLevel(logging.ERROR)
 
 app = Flask(__name__)
 
@@ -54,10 +75,82 @@ app = Flask(__name__)
 SCRIPT_DIR = Path(__file__).parent
 TELEGRAM_SCRIPT = SCRIPT_DIR / "simple_sender.sh"
 
+if str(SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPT_DIR))
+
+from config_loader import load_config
+
+CONFIG = load_config()
+
+# Telegram credentials; without them alerts go through simple_sender.sh,
+# which can also read them from a .secrets file
+TELEGRAM_TOKEN: str = CONFIG["telegram"].get("token", "")
+TELEGRAM_CHAT_ID: str = str(CONFIG["telegram"].get("chat_id", ""))
+TELEGRAM_API_URL = f"https://api.telegram.org/bot{TELEGRAM_TOKEN}/sendMessage"
+TELEGRAM_CONNECT_TIMEOUT = 5
+TELEGRAM_TIMEOUT = 10
+
+# Longest Retry-After (seconds) honoured on a 429 before giving up the wait.
+# With 2 retries the worst case send (connect timeouts, capped waits, one
+# full read) stays around 30s, well under gunicorn's 60s worker timeout.
+RETRY_AFTER_MAX = 5
+
+
+class _SendRetry(Retry):
+    """Retry policy for sendMessage with a capped Retry-After wait."""
+
+    def parse_retry_after(self, retry_after: str) -> float:
+        """Seconds to wait for a Retry-After header, at most RETRY_AFTER_MAX."""
+        return min(super().parse_retry_after(retry_after), RETRY_AFTER_MAX)
+
+
+# Shared HTTP session so sends reuse one keep-alive TLS connection. sendMessage
+# is not idempotent, so only failures where Telegram cannot have delivered the
+# message are retried: connection errors and 429 (read errors and 5xx are not,
+# since the message may already have been sent).
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=_SendRetry(
+            total=2,
+            read=0,
+            backoff_factor=0.5,
+            status_forcelist=(429,),
+            allowed_methods=frozenset({"POST"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        ),
+    ),
+)
+
+# Alerts of one webhook batch are sent concurrently by this pool
+SEND_WORKERS = 8
+SEND_EXECUTOR = ThreadPoolExecutor(
+    max_workers=SEND_WORKERS, thread_name_prefix="telegram-send"
+)
+
 # Alert Deduplication State
 STATE_DIR = Path(os.environ.get("STATE_DIR", "/tmp/prometheus-webhook"))
 STATE_FILE = STATE_DIR / "alert_state.json"
 DEDUP_WINDOW_HOURS = int(os.environ.get("DEDUP_WINDOW_HOURS", "24"))
+# Seconds to wait after a change before writing the state file, so a
+# burst of webhook calls results in a single write
+STATE_FLUSH_DELAY = 1.0
+# Expired entries are harmless to dedup (should_send_alert checks the age),
+# so they are only pruned every Nth webhook call or when the state grows
+CLEANUP_EVERY_REQUESTS = 100
+CLEANUP_MAX_ENTRIES = 1000
+
+# Labels identifying an alert for deduplication, with defaults for missing ones
+FINGERPRINT_LABELS = (
+    ("alertname", "unknown"),
+    ("instance", "unknown"),
+    ("component", ""),
+    ("severity", ""),
+)
 
 # Alert Templates (customizable)
 ALERT_TEMPLATES: dict[str, dict[str, str]] = {
@@ -108,6 +201,25 @@ ALERT_TEMPLATES: dict[str, dict[str, str]] = {
 }
 
 
+def json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize an object to JSON bytes, using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode()
+
+
+def json_response(obj: Any, status: int = 200) -> Response:
+    """Build a JSON HTTP response."""
+    return Response(json_dumps(obj), status=status, mimetype="application/json")
+
+
 def get_alert_fingerprint(alert: dict[str, Any]) -> str:
     """
     Generate unique fingerprint for alert deduplication.
@@ -116,14 +228,31 @@ def get_alert_fingerprint(alert: dict[str, Any]) -> str:
         alert: Prometheus alert dictionary
 
     Returns:
-        MD5 hash of alert labels
+        BLAKE2b-128 hash of alert labels
+    """
+    labels = alert.get("labels", {})
+    h = hashlib.blake2b(digest_size=16)
+    for key, default in FINGERPRINT_LABELS:
+        h.update(str(labels.get(key, default)).encode())
+        h.update(b"\x00")
+    return h.hexdigest()
+
+
+def get_legacy_fingerprint(alert: dict[str, Any]) -> str:
+    """
+    Generate the fingerprint used before the switch to BLAKE2b.
+
+    Only needed to recognise entries in state files written by older versions.
+
+    Args:
+        alert: Prometheus alert dictionary
+
+    Returns:
+        MD5 hash of the JSON-encoded alert labels
     """
     labels = alert.get("labels", {})
     fingerprint_data = {
-        "alertname": labels.get("alertname", "unknown"),
-        "instance": labels.get("instance", "unknown"),
-        "component": labels.get("component", ""),
-        "severity": labels.get("severity", ""),
+        key: labels.get(key, default) for key, default in FINGERPRINT_LABELS
     }
     fingerprint_str = json.dumps(fingerprint_data, sort_keys=True)
     return hashlib.md5(fingerprint_str.encode()).hexdigest()
@@ -133,23 +262,56 @@ def load_alert_state() -> dict[str, float]:
     """Load previously sent alerts from state file."""
     try:
         if STATE_FILE.exists():
-            with open(STATE_FILE, "r") as f:
-                return json.load(f)
+            return json_loads(STATE_FILE.read_bytes())
     except Exception as e:
         logger.warning(f"Failed to load alert state: {e}")
     return {}
 
 
 def save_alert_state(state: dict[str, float]) -> None:
-    """Save sent alerts to state file."""
+    """Save sent alerts to state file (atomically via a temp file)."""
     try:
         STATE_DIR.mkdir(parents=True, exist_ok=True)
-        with open(STATE_FILE, "w") as f:
-            json.dump(state, f, indent=2)
+        tmp_file = STATE_FILE.with_suffix(".tmp")
+        tmp_file.write_bytes(json_dumps(state, indent=True))
+        os.replace(tmp_file, STATE_FILE)
     except Exception as e:
         logger.error(f"Failed to save alert state: {e}")
 
 
+# Alert state is kept in-process and only written back to disk after changes;
+# all access goes through _state_lock since Flask may serve requests in threads
+ALERT_STATE = load_alert_state()
+_state_lock = threading.Lock()
+_flush_timer: threading.Timer | None = None
+_requests_since_cleanup = 0
+
+# Keys loaded from disk that may be legacy MD5 fingerprints. Each is resolved
+# on first contact (rekeyed to the BLAKE2b fingerprint, or confirmed current)
+# or when it expires, so an upgrade does not resend every active alert.
+_legacy_keys = set(ALERT_STATE)
+
+
+def flush_alert_state() -> None:
+    """Write a snapshot of the in-process alert state to disk."""
+    global _flush_timer
+    with _state_lock:
+        _flush_timer = None
+        snapshot = dict(ALERT_STATE)
+    save_alert_state(snapshot)
+
+
+def schedule_state_flush() -> None:
+    """Mark alert state dirty and write it after STATE_FLUSH_DELAY seconds."""
+    global _flush_timer
+    with _state_lock:
+        if _flush_timer is not None:
+            return
+        _flush_timer = threading.Timer(STATE_FLUSH_DELAY, flush_alert_state)
+        _flush_timer.daemon = True
+        _flush_timer.start()
+
+
 def should_send_alert(alert: dict[str, Any], state: dict[str, float]) -> bool:
     """
     Check if alert should be sent based on deduplication logic.
@@ -164,6 +326,16 @@ def should_send_alert(alert: dict[str, Any], state: dict[str, float]) -> bool:
     fingerprint = get_alert_fingerprint(alert)
     current_time = time.time()
 
+    if _legacy_keys:
+        if fingerprint in state:
+            _legacy_keys.discard(fingerprint)
+        else:
+            legacy = get_legacy_fingerprint(alert)
+            if legacy in _legacy_keys:
+                _legacy_keys.discard(legacy)
+                if legacy in state:
+                    state[fingerprint] = state.pop(legacy)
+
     if fingerprint in state:
         last_sent = state[fingerprint]
         hours_since_sent = (current_time - last_sent) / 3600
@@ -179,18 +351,66 @@ def should_send_alert(alert: dict[str, Any], state: dict[str, float]) -> bool:
     return True
 
 
-def cleanup_old_state(state: dict[str, float]) -> dict[str, float]:
-    """Remove alerts older than dedup window from state."""
+def cleanup_old_state(state: dict[str, float]) -> int:
+    """
+    Remove alerts older than dedup window from state, in place.
+
+    Args:
+        state: Alert state to prune
+
+    Returns:
+        Number of removed entries
+    """
     current_time = time.time()
     cutoff_time = current_time - (DEDUP_WINDOW_HOURS * 3600)
 
-    cleaned_state = {fp: ts for fp, ts in state.items() if ts > cutoff_time}
+    expired = [fp for fp, ts in state.items() if ts <= cutoff_time]
+    for fp in expired:
+        del state[fp]
+    _legacy_keys.difference_update(expired)
 
-    removed_count = len(state) - len(cleaned_state)
-    if removed_count > 0:
-        logger.info(f"Cleaned {removed_count} old alerts from state")
+    if expired:
+        logger.info(f"Cleaned {len(expired)} old alerts from state")
 
-    return cleaned_state
+    return len(expired)
+
+
+@functools.lru_cache(maxsize=None)
+def compile_template(
+    template_format: str,
+) -> tuple[Callable[[dict[str, Any]], str], bool]:
+    """
+    Parse an alert template once into a render function.
+
+    Args:
+        template_format: str.format-style template string
+
+    Returns:
+        Tuple of (render function taking the field values, whether the
+        template uses {description})
+    """
+    segments: list[tuple[str, str | None]] = []
+    for literal, field, spec, conversion in string.Formatter().parse(template_format):
+        if spec or conversion:
+            # Not a plain {field}; leave it to str.format
+            fields = {f for _, f, _, _ in string.Formatter().parse(template_format)}
+            return template_format.format_map, "description" in fields
+        if literal:
+            segments.append((literal, None))
+        if field is not None:
+            segments.append(("", field))
+
+    def render(values: dict[str, Any]) -> str:
+        # str() like str.format does: label/annotation values may be null
+        # or numeric in the payload
+        return "".join(
+            [
+                literal if field is None else str(values[field])
+                for literal, field in segments
+            ]
+        )
+
+    return render, any(field == "description" for _, field in segments)
 
 
 def format_telegram_message(alert: dict[str, Any]) -> str:
@@ -215,23 +435,67 @@ def format_telegram_message(alert: dict[str, Any]) -> str:
     # Get template for this alert type
     template = ALERT_TEMPLATES.get(alertname, ALERT_TEMPLATES["default"])
 
-    message = template["format"].format(
-        emoji=template["emoji"],
-        alertname=alertname,
-        status=status.upper(),
-        severity=severity,
-        summary=summary,
-        description=description,
+    render, has_description = compile_template(template["format"])
+
+    message = render(
+        {
+            "emoji": template["emoji"],
+            "alertname": alertname,
+            "status": status.upper(),
+            "severity": severity,
+            "summary": summary,
+            "description": description,
+        }
     )
 
     # Add description if present and not in template
-    if description and "{description}" not in template["format"]:
+    if description and not has_description:
         message += f"\n\nDescription:\n{description}"
 
     return message
 
 
 def send_telegram_alert(message: str) -> bool:
+    """
+    Send Telegram alert via the Bot API (or simple_sender.sh as fallback).
+
+    Args:
+        message: Formatted Telegram message
+
+    Returns:
+        True on success, False on failure
+    """
+    if not (TELEGRAM_TOKEN and TELEGRAM_CHAT_ID):
+        return send_telegram_alert_script(message)
+
+    try:
+        response = SESSION.post(
+            TELEGRAM_API_URL,
+            json={
+                "chat_id": TELEGRAM_CHAT_ID,
+                "text": message,
+                "disable_web_page_preview": True,
+            },
+            timeout=(TELEGRAM_CONNECT_TIMEOUT, TELEGRAM_TIMEOUT),
+        )
+        if response.ok:
+            logger.info("Telegram alert sent successfully")
+            return True
+        logger.error(
+            f"Telegram API error {response.status_code}: {response.text[:200]}"
+        )
+        return False
+
+    except requests.Timeout:
+        logger.error("Telegram API timed out")
+        return False
+    except requests.RequestException as e:
+        # The exception text contains the request URL, i.e. the bot token
+        logger.error(f"Failed to send Telegram alert: {type(e).__name__}")
+        return False
+
+
+def send_telegram_alert_script(message: str) -> bool:
     """
     Send Telegram alert via simple_sender.sh script.
 
@@ -289,9 +553,11 @@ def webhook():
     }
     """
     try:
-        data = request.get_json()
+        # Parse the raw body directly instead of going through request.get_json()
+        body = request.get_data(cache=False)
+        data = json_loads(body) if body else None
         if not data:
-            return jsonify({"error": "No JSON data received"}), 400
+            return json_response({"error": "No JSON data received"}, 400)
 
         # Handle both dict (with 'alerts' key) and list (direct alerts array)
         if isinstance(data, list):
@@ -301,29 +567,56 @@ def webhook():
 
         if not alerts:
             logger.warning("Received webhook call without alerts")
-            return jsonify({"status": "ok", "message": "No alerts to process"}), 200
+            return json_response({"status": "ok", "message": "No alerts to process"})
 
         logger.info(f"Received {len(alerts)} alert(s)")
 
-        # Load and clean alert state
-        alert_state = load_alert_state()
-        alert_state = cleanup_old_state(alert_state)
+        global _requests_since_cleanup
 
         sent_count = 0
         suppressed_count = 0
-
-        for alert in alerts:
+        pending: list[tuple[dict[str, Any], str]] = []
+
+        # Dedup decisions under the lock; sending happens outside of it
+        with _state_lock:
+            _requests_since_cleanup += 1
+            if (
+                _requests_since_cleanup >= CLEANUP_EVERY_REQUESTS
+                or len(ALERT_STATE) > CLEANUP_MAX_ENTRIES
+            ):
+                cleanup_old_state(ALERT_STATE)
+                _requests_since_cleanup = 0
+
+        try:
+            with _state_lock:
+                for alert in alerts:
+                    alertname = alert.get("labels", {}).get("alertname", "Unknown")
+                    status = alert.get("status", "unknown")
+
+                    logger.info(f"Processing alert: {alertname} (status: {status})")
+
+                    # Format first: a malformed alert must not be recorded as sent
+                    message = format_telegram_message(alert)
+                    if not should_send_alert(alert, ALERT_STATE):
+                        suppressed_count += 1
+                        continue
+
+                    pending.append((alert, message))
+
+            messages = [message for _, message in pending]
+            if len(messages) > 1:
+                results = list(SEND_EXECUTOR.map(send_telegram_alert, messages))
+            else:
+                results = [send_telegram_alert(message) for message in messages]
+        except Exception:
+            # Nothing was sent for this request; forget what was recorded
+            with _state_lock:
+                for alert, _ in pending:
+                    ALERT_STATE.pop(get_alert_fingerprint(alert), None)
+            raise
+
+        for (alert, _), success in zip(pending, results):
             alertname = alert.get("labels", {}).get("alertname", "Unknown")
-            status = alert.get("status", "unknown")
-
-            logger.info(f"Processing alert: {alertname} (status: {status})")
-
-            if not should_send_alert(alert, alert_state):
-                suppressed_count += 1
-                continue
-
-            message = format_telegram_message(alert)
-            success = send_telegram_alert(message)
 
             if success:
                 logger.info(f"Alert {alertname} sent to Telegram")
@@ -332,47 +625,42 @@ def webhook():
                 logger.error(f"Failed to send alert {alertname}")
                 # Remove from state if send failed
                 fingerprint = get_alert_fingerprint(alert)
-                alert_state.pop(fingerprint, None)
+                with _state_lock:
+                    ALERT_STATE.pop(fingerprint, None)
 
-        save_alert_state(alert_state)
+        schedule_state_flush()
 
         logger.info(
             f"Processed {len(alerts)} alerts: {sent_count} sent, {suppressed_count} suppressed"
         )
-        return (
-            jsonify(
-                {
-                    "status": "ok",
-                    "total": len(alerts),
-                    "sent": sent_count,
-                    "suppressed": suppressed_count,
-                }
-            ),
-            200,
+        return json_response(
+            {
+                "status": "ok",
+                "total": len(alerts),
+                "sent": sent_count,
+                "suppressed": suppressed_count,
+            }
         )
 
     except (KeyError, ValueError, TypeError) as e:
         logger.error(f"Invalid webhook payload: {e}")
-        return jsonify({"error": "Invalid payload format"}), 400
+        return json_response({"error": "Invalid payload format"}, 400)
     except OSError as e:
         logger.error(f"Network/IO error processing webhook: {e}")
-        return jsonify({"error": "Internal server error"}), 500
+        return json_response({"error": "Internal server error"}, 500)
 
 
 @app.route("/health", methods=["GET"])
 def health():
     """Health check endpoint."""
-    return jsonify({"status": "healthy"}), 200
+    return json_response({"status": "healthy"})
 
 
 @app.route("/templates", methods=["GET"])
 def list_templates():
     """List available alert templates."""
-    return (
-        jsonify(
-            {"templates": list(ALERT_TEMPLATES.keys()), "count": len(ALERT_TEMPLATES)}
-        ),
-        200,
+    return json_response(
+        {"templates": list(ALERT_TEMPLATES.keys()), "count": len(ALERT_TEMPLATES)}
     )
 
 
@@ -386,6 +674,9 @@ def main() -> int:
 
     app.run(host=host, port=port, debug=False)
 
+    # Persist any state change still waiting for the debounced flush
+    flush_alert_state()
+
     return 0
 
 